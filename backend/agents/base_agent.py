@@ -1,10 +1,28 @@
 import logging
+import os
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
+import httpx
+import openai
 from models import ParticipantSession
+from audio.translation_service import shared_async_openai
 
 logger = logging.getLogger(__name__)
 
+# Completions (greetings, eligibility evaluation) can take longer than the
+# translation pool's 15 s read timeout
+_AGENT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """
+    AsyncOpenAI client for the agents' LLM calls
+    
+    Shares the translation service's keep-alive connection pool, so agent
+    calls reuse warm TLS connections, don't block the event loop, and are
+    closed with the audio clients on shutdown.
+    """
+    return shared_async_openai(os.getenv("OPENAI_API_KEY")).with_options(timeout=_AGENT_TIMEOUT)
+
 class BaseAgent(ABC):
     """Abstract base class for all conversation agents"""
     
@@ -1,6 +1,5 @@
-import openai
 from typing import Dict
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, get_openai_client
 
 class ConsentAgent(BaseAgent):
     """Agent responsible for handling consent flow"""
@@ -12,7 +11,7 @@ class ConsentAgent(BaseAgent):
     async def get_initial_message(self) -> Dict:
         """Generate the initial greeting message"""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             # Prepare comprehensive study context for LLM
             trial = self.trial_info.get("trial", {})
@@ -52,7 +51,7 @@ class ConsentAgent(BaseAgent):
             Generate a concise greeting:
             """
 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=300,
@@ -109,7 +108,7 @@ Do you consent to proceed with the screening questions, or do you have any quest
         
         try:
             # Use LLM to determine if user consented
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             prompt = f"""
             Analyze this spoken response to a consent request for participating in a clinical trial screening interview.
@@ -134,7 +133,7 @@ Do you consent to proceed with the screening questions, or do you have any quest
             Respond with only: YES, NO, or CLARIFY
             """
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
@@ -186,7 +185,7 @@ Do you consent to proceed with the screening questions, or do you have any quest
     async def _generate_consent_clarification(self, user_message: str) -> str:
         """Generate personalized consent clarification using LLM and study context"""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             
              # Prepare comprehensive study context for LLM
             trial = self.trial_info.get("trial", {})
@@ -249,7 +248,7 @@ Do you consent to proceed with the screening questions, or do you have any quest
             Generate a helpful, personalized response:
             """
 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
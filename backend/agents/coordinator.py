@@ -7,6 +7,9 @@ from .submission_agent import SubmissionAgent
 
 logger = logging.getLogger(__name__)
 
+# Closing message sent once eligibility has been evaluated
+COMPLETION_MESSAGE = "Thank you for completing the screening interview! Your responses have been recorded and evaluated."
+
 class ClinicalTrialCoordinator:
     """
     Coordinator that maintains the same API as the original ClinicalTrialAgent
@@ -163,7 +166,7 @@ class ClinicalTrialCoordinator:
         """Handle completion after evaluation"""
         self.conversation_state = "completed"
         return {
-            "content": "Thank you for completing the screening interview! Your responses have been recorded and evaluated.",
+            "content": COMPLETION_MESSAGE,
             "requires_response": False,
             "is_final": True,
             "question_number": len(self.trial_criteria),
@@ -191,7 +194,7 @@ class ClinicalTrialCoordinator:
         """Complete the interview after evaluation - backward compatibility"""
         self.conversation_state = "completed"
         return {
-            "content": "Thank you for completing the screening interview! Your responses have been recorded and evaluated.",
+            "content": COMPLETION_MESSAGE,
             "requires_response": False,
             "is_final": True,
             "question_number": len(self.trial_criteria),
@@ -4,11 +4,10 @@ import re
 import asyncio
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
-import os
-from openai import OpenAI
 from dotenv import load_dotenv
 
 from models import ParticipantSession, TrialCriteria, load_trial_criteria
+from .base_agent import get_openai_client
 
 load_dotenv()
 
@@ -19,8 +18,8 @@ class EligibilityEvaluator:
         self.study_id = study_id
         self.trial_criteria = load_trial_criteria(study_id)
         
-        # Initialize OpenAI client
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Shared OpenAI client, reusing pooled connections across evaluations
+        self.openai_client = get_openai_client()
         
         # Decision algorithm constants
         self.HIGH_PRIORITY_CONFIDENCE_THRESHOLD = 0.8
@@ -64,9 +63,9 @@ class EligibilityEvaluator:
         # 3. Final threshold check
         return 'Accept' if total >= self.DECISION_THRESHOLD else 'Reject'
     
-    def _get_llm_response(self, system_prompt: str, user_prompt: str, model: str = "gpt-4o-mini") -> str:
+    async def _get_llm_response(self, system_prompt: str, user_prompt: str, model: str = "gpt-4o-mini") -> str:
         """Get LLM response using OpenAI API"""
-        response = self.openai_client.chat.completions.create(
+        response = await self.openai_client.chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -225,8 +224,8 @@ class EligibilityEvaluator:
             }}
             """
             
-            # Note: _get_llm_response is synchronous, but we can run it in parallel
-            evaluation_text = self._get_llm_response(system_prompt="You are a clinical trial eligibility evaluator. Provide accurate JSON responses.", user_prompt=evaluation_prompt, model="gpt-4o")
+            # Awaited on the async client, so evaluate_eligibility's gather runs criteria concurrently
+            evaluation_text = await self._get_llm_response(system_prompt="You are a clinical trial eligibility evaluator. Provide accurate JSON responses.", user_prompt=evaluation_prompt, model="gpt-4o")
 
             # Parse JSON response
             evaluation = json.loads(evaluation_text)
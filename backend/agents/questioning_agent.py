@@ -1,6 +1,5 @@
-import openai
 from typing import Dict
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, get_openai_client
 
 class QuestioningAgent(BaseAgent):
     """Agent responsible for handling eligibility criteria questioning"""
@@ -24,7 +23,7 @@ class QuestioningAgent(BaseAgent):
             current_criteria = self.trial_criteria[self.current_criteria_index]
             
             # Use LLM to classify user intent
-            intent = self._classify_user_intent(user_input, current_criteria)
+            intent = await self._classify_user_intent(user_input, current_criteria)
             
             if intent == "ambiguous":
                 # Speech was unclear - ask user to speak more clearly without advancing
@@ -140,14 +139,14 @@ class QuestioningAgent(BaseAgent):
             total_questions=len(self.trial_criteria)
         )
     
-    def _classify_user_intent(self, user_message: str, current_criteria=None) -> str:
+    async def _classify_user_intent(self, user_message: str, current_criteria=None) -> str:
         """Use LLM to classify user intent from their message during questioning phase"""
         try:
             # First, check for exact "Ambiguous sound." match directly (more reliable than LLM)
             if user_message.strip() == "Ambiguous sound.":
                 return "ambiguous"
             
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             # Build context section for questioning phase
             context_section = ""
@@ -196,7 +195,7 @@ class QuestioningAgent(BaseAgent):
             NOTE: In case of doubt, prefer "answer" over "unclear" to avoid getting stuck. Always respect user's choice to decline/withdraw.
             """
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
@@ -220,7 +219,7 @@ class QuestioningAgent(BaseAgent):
     async def _handle_unclear_response(self, user_message: str) -> Dict:
         """Handle unclear response using LLM with full context"""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             # Get current question context
             current_criteria = self.trial_criteria[self.current_criteria_index]
@@ -268,7 +267,7 @@ class QuestioningAgent(BaseAgent):
             Generate a helpful response:
             """
 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
@@ -1,6 +1,5 @@
-import openai
 from typing import Dict
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, get_openai_client
 
 class SubmissionAgent(BaseAgent):
     """Agent responsible for handling final submission and study questions"""
@@ -22,7 +21,7 @@ class SubmissionAgent(BaseAgent):
     async def process_input(self, user_input: str) -> Dict:
         """Process submission-related user input"""
         # Use submission-specific LLM to classify user intent
-        intent = self._classify_submission_user_intent(user_input)
+        intent = await self._classify_submission_user_intent(user_input)
         
         if intent == "ambiguous":
             # Speech was unclear - ask user to speak more clearly
@@ -74,14 +73,14 @@ class SubmissionAgent(BaseAgent):
             # Use LLM to handle unclear response in submission phase
             return await self._handle_unclear_submission_response(user_input)
     
-    def _classify_submission_user_intent(self, user_message: str) -> str:
+    async def _classify_submission_user_intent(self, user_message: str) -> str:
         """Use LLM to classify user intent from their message during submission phase"""
         try:
             # First, check for exact "Ambiguous sound." match directly (more reliable than LLM)
             if user_message.strip() == "Ambiguous sound.":
                 return "ambiguous"
             
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             prompt = f"""
             You are analyzing a user's spoken response in a clinical trial interview during the SUBMISSION PHASE to determine their intent.
@@ -123,7 +122,7 @@ class SubmissionAgent(BaseAgent):
             NOTE: When user says "repeat" during submission, they mean repeat the submission instruction.
             """
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
@@ -147,7 +146,7 @@ class SubmissionAgent(BaseAgent):
     async def _handle_unclear_submission_response(self, user_message: str) -> Dict:
         """Handle unclear response during submission phase - may be study questions like consent phase"""
         try:
-            client = openai.OpenAI()
+            client = get_openai_client()
             
             # Prepare study context (same as consent clarification)
             overview = self.trial_info.get("overview", {})
@@ -211,7 +210,7 @@ class SubmissionAgent(BaseAgent):
             Generate a helpful, personalized response:
             """
 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
@@ -4,14 +4,26 @@ Audio Settings and TTS API Endpoints
 
 import os
 import logging
-import base64
-import openai
+from contextlib import AsyncExitStack
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from .models import VoicePreviewRequest
+from audio.audio_utils import AudioUtils
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Bytes per chunk forwarded from OpenAI's streamed TTS response
+_PREVIEW_STREAM_CHUNK_SIZE = 4096
+
+# Speech speed range offered in the voice settings
+_MIN_SPEED = 0.25
+_MAX_SPEED = 2.0
+
+def _clamp_speed(speed: float) -> float:
+    """Clamp a speech speed to the range offered in the settings"""
+    return max(_MIN_SPEED, min(_MAX_SPEED, float(speed)))
+
 # Audio processor will be set from main server
 audio_processor = None
 
@@ -34,7 +46,7 @@ async def get_supported_languages():
 async def get_available_voices():
     """Get list of available TTS voices"""
     try:
-        voices = audio_processor.get_available_voices()
+        voices = await audio_processor.aget_available_voices()
         return {"voices": voices}
     except Exception as e:
         logger.error(f"Error getting voices: {e}")
@@ -51,21 +63,23 @@ async def generate_voice_preview(request: Request):
         speed = float(data.get("speed", 1.0))
         
         # Clamp speed to valid range
-        speed = max(0.25, min(4.0, speed))
-        
-        # Temporarily set the output language for preview
-        original_language = audio_processor.output_language
-        audio_processor.output_language = language
+        speed = _clamp_speed(speed)
         
-        # Generate preview audio using OpenAI TTS with specified voice and speed
+        # Generate preview audio using OpenAI TTS with specified voice and speed.
+        # The language is passed explicitly; the shared processor's output
+        # language must not change while other sessions are mid-turn.
         
         # Translate preview text if needed
         if language != "english":
-            preview_text = audio_processor.translate_text(text, language)
+            preview_text = await audio_processor.atranslate_text(text, language)
         else:
             preview_text = text
             
-        response = openai.audio.speech.create(
+        # Await the shared AsyncOpenAI client instead of blocking the event loop
+        client = audio_processor.translation_service.aclient
+        if client is None:
+            raise RuntimeError("OpenAI API key not configured")
+        response = await client.audio.speech.create(
             model="tts-1",
             voice=voice,
             input=preview_text,
@@ -73,10 +87,7 @@ async def generate_voice_preview(request: Request):
         )
         
         # Convert to base64
-        audio_base64 = base64.b64encode(response.content).decode('utf-8')
-        
-        # Restore original language
-        audio_processor.output_language = original_language
+        audio_base64 = await AudioUtils.abytes_to_base64(response.content)
         
         return {"audio": audio_base64}
         
@@ -84,6 +95,50 @@ async def generate_voice_preview(request: Request):
         logger.error(f"Error generating voice preview: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate voice preview")
 
+@router.get("/voice-preview/stream")
+async def stream_voice_preview(text: str = "Hello, this is a preview of my voice.", voice: str = "nova",
+                               language: str = "english", speed: float = 1.0):
+    """Stream a voice preview sample as MP3 while it is still being synthesized"""
+    # Open the upstream stream and read its first chunk before committing to a
+    # 200, so provider failures surface as a 500 instead of an empty body
+    stack = AsyncExitStack()
+    try:
+        speed = _clamp_speed(speed)
+        if language != "english":
+            text = await audio_processor.atranslate_text(text, language)
+        
+        client = audio_processor.translation_service.aclient
+        if client is None:
+            raise RuntimeError("OpenAI API key not configured")
+        
+        response = await stack.enter_async_context(client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=voice,
+            input=text,
+            speed=speed,
+            response_format="mp3"
+        ))
+        chunks = response.iter_bytes(chunk_size=_PREVIEW_STREAM_CHUNK_SIZE)
+        first_chunk = await chunks.__anext__()
+    except Exception as e:
+        await stack.aclose()
+        logger.error(f"Error generating voice preview stream: {e}")
+        raise HTTPException(status_code=500, detail="Failed to generate voice preview")
+    
+    async def audio_chunks():
+        # Forward chunks as OpenAI produces them so playback starts on the first one
+        try:
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            # Headers are already sent; all that's left is ending the body early
+            logger.error(f"Voice preview stream interrupted: {e}")
+        finally:
+            await stack.aclose()
+    
+    return StreamingResponse(audio_chunks(), media_type="audio/mpeg")
+
 @router.post("/settings")
 async def update_audio_settings(request: Request):
     """Update audio settings (language, voice, and speed)"""
@@ -94,15 +149,14 @@ async def update_audio_settings(request: Request):
         speed = float(data.get("speed", 1.0))
         
         # Clamp speed to valid range
-        speed = max(0.25, min(2.0, speed))  # Using 2.0 as max per user request
+        speed = _clamp_speed(speed)
         
         # Validate language
-        supported_languages = [lang["code"] for lang in audio_processor.get_supported_languages()]
-        if output_language not in supported_languages:
+        if not audio_processor.language_manager.is_language_supported(output_language):
             raise HTTPException(status_code=400, detail=f"Unsupported language: {output_language}")
         
         # Validate voice
-        available_voices = [voice_item["id"] for voice_item in audio_processor.get_available_voices()]
+        available_voices = [voice_item["id"] for voice_item in await audio_processor.aget_available_voices()]
         if voice not in available_voices:
             raise HTTPException(status_code=400, detail=f"Unsupported voice: {voice}")
         
@@ -143,7 +197,7 @@ async def get_audio_settings():
             "voice": current_voice,
             "speed": current_speed,
             "available_languages": audio_processor.get_supported_languages(),
-            "available_voices": audio_processor.get_available_voices()
+            "available_voices": await audio_processor.aget_available_voices()
         }
         
     except Exception as e:
@@ -166,7 +220,7 @@ async def get_google_tts_models():
 async def get_google_tts_voices(language: str = "english"):
     """Get list of available Google TTS voices for a language"""
     try:
-        voices = audio_processor.get_available_voices(language)
+        voices = await audio_processor.aget_available_voices(language)
         return {"voices": voices, "language": language}
     except Exception as e:
         logger.error(f"Error getting Google TTS voices: {e}")
@@ -189,8 +243,7 @@ async def update_google_tts_settings(request: Request):
         
         if language:
             # Validate language
-            supported_languages = [lang["code"] for lang in audio_processor.get_supported_languages()]
-            if language not in supported_languages:
+            if not audio_processor.language_manager.is_language_supported(language):
                 raise HTTPException(status_code=400, detail=f"Unsupported language: {language}")
             settings["language"] = language
             
@@ -207,8 +260,8 @@ async def update_google_tts_settings(request: Request):
         if speed is not None:
             # Validate speed range
             speed = float(speed)
-            if speed < 0.25 or speed > 4.0:
-                raise HTTPException(status_code=400, detail="Speed must be between 0.25 and 4.0")
+            if speed < _MIN_SPEED or speed > _MAX_SPEED:
+                raise HTTPException(status_code=400, detail=f"Speed must be between {_MIN_SPEED} and {_MAX_SPEED}")
             settings["speed"] = speed
         
         # Update Google TTS settings
@@ -305,7 +358,7 @@ async def translate_text(request: Request):
             raise HTTPException(status_code=400, detail="text is required")
         
         # Use audio processor's translation method with gender awareness
-        translated_text = audio_processor.translate_text(text, target_language, gender)
+        translated_text = await audio_processor.atranslate_text(text, target_language, gender)
         
         return {"translated_text": translated_text}
         
@@ -10,12 +10,28 @@ from datetime import datetime
 from typing import Dict, List
 from fastapi import WebSocket, WebSocketDisconnect
 
+try:
+    import orjson  # several times faster than json on frames carrying base64 audio
+except ImportError:
+    orjson = None
+
 from models import create_session, save_conversation_data, save_evaluation_data, ParticipantSession
 from agents import ClinicalTrialCoordinator as ClinicalTrialAgent
+from agents.coordinator import COMPLETION_MESSAGE
 from agents.evaluation_agent import EligibilityEvaluator
 
 logger = logging.getLogger(__name__)
 
+def _dumps(message: dict) -> str:
+    """Serialize an outgoing WebSocket message, via orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Types orjson rejects fall through to the stdlib encoder
+            pass
+    return json.dumps(message)
+
 # Global variables that will be set by main app
 audio_processor = None
 session_registry = None
@@ -139,7 +155,7 @@ class ConnectionManager:
     async def send_message(self, session_id: str, message: dict):
         """Send a message to a specific WebSocket connection"""
         if session_id in self.active_connections:
-            await self.active_connections[session_id].send_text(json.dumps(message))
+            await self.active_connections[session_id].send_text(_dumps(message))
 
 # Global connection manager instance
 manager = ConnectionManager()
@@ -277,25 +293,30 @@ async def handle_text_input(session_id: str, user_message: str):
             
             # Check if we need to start evaluation
             if agent_response.get("evaluating", False) and session:
-                # Small delay before starting evaluation
-                await asyncio.sleep(1.0)
-                
-                # Get study ID for this session
-                study_id = manager.session_studies.get(session_id)
-                if not study_id:
-                    raise ValueError(f"No study ID found for session {session_id}")
-                
-                # Create study-specific evaluator
-                study_evaluator = EligibilityEvaluator(study_id)
-                
-                # Evaluate eligibility (now async for parallel processing)
-                eligibility_result = await study_evaluator.evaluate_eligibility(session)
-                
-                # Complete the interview
-                completion_response = agent.complete_interview()
-                
-                # Generate audio for completion message
-                completion_audio = await audio_processor.text_to_speech(completion_response["content"])
+                # The completion message doesn't depend on the evaluation, so
+                # synthesize it while the evaluation runs
+                completion_audio_task = audio_processor.speculative_text_to_speech(COMPLETION_MESSAGE)
+                try:
+                    # Small delay before starting evaluation
+                    await asyncio.sleep(1.0)
+                    
+                    # Get study ID for this session
+                    study_id = manager.session_studies.get(session_id)
+                    if not study_id:
+                        raise ValueError(f"No study ID found for session {session_id}")
+                    
+                    # Create study-specific evaluator
+                    study_evaluator = EligibilityEvaluator(study_id)
+                    
+                    # Evaluate eligibility (now async for parallel processing)
+                    eligibility_result = await study_evaluator.evaluate_eligibility(session)
+                    
+                    # Complete the interview (its message is always COMPLETION_MESSAGE)
+                    completion_response = agent.complete_interview()
+                    completion_audio = await completion_audio_task
+                finally:
+                    # Don't leave the synthesis running if the evaluation failed
+                    completion_audio_task.cancel()
                 
                 # Track completion message
                 manager.add_message(session_id, "agent", completion_response["content"])
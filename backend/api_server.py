@@ -67,6 +67,26 @@ set_dependencies(audio_processor, session_registry)
 # Include organized API routes
 app.include_router(create_api_routes(), prefix="/api")
 
+@app.on_event("startup")
+async def warm_preview_cache():
+    """Pre-translate voice preview phrases in the background so previews skip OpenAI"""
+    # Opt-in: the warm-up spends OpenAI quota on every deploy, while previews
+    # are rare and already cached persistently once translated
+    if os.getenv("PREVIEW_WARMUP", "false").lower() == "true":
+        # Keep a reference so the task isn't garbage collected mid-run
+        app.state.preview_warmup = asyncio.create_task(audio_processor.warm_preview_cache())
+
+@app.on_event("startup")
+async def warm_up_clients():
+    """Open Google and OpenAI connections in the background so the first turn skips the cold start"""
+    if os.getenv("CLIENT_WARMUP", "true").lower() == "true":
+        app.state.client_warmup = asyncio.create_task(audio_processor.warm_up_clients())
+
+@app.on_event("shutdown")
+async def close_audio_clients():
+    """Close pooled HTTP/2 and gRPC connections to OpenAI and Google"""
+    await audio_processor.aclose()
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from typing import Optional, Dict, List
@@ -37,6 +38,37 @@ class AudioCoordinator:
         
         logger.info(f"Audio coordinator initialized with output language: {self.output_language}")
     
+    async def aclose(self):
+        """Release the OpenAI connection pool and Google gRPC channels on shutdown"""
+        await self.translation_service.aclose()
+        self.stt_service.close()
+        self.tts_service.close()
+    
+    async def warm_up_clients(self) -> None:
+        """
+        Open provider connections before the first turn needs them
+        
+        Builds the Google STT client, lists the TTS voices (which creates the
+        TTS client and fills the voice cache) and retrieves the translation
+        model so the shared OpenAI pool holds a warm TLS connection. These are
+        free metadata calls; failures are only logged, leaving the first real
+        call to pay the cold start.
+        """
+        steps = []
+        if self.stt_service.google_credentials:
+            steps.append(asyncio.to_thread(self.stt_service.get_client))
+        if self.tts_service.google_credentials:
+            steps.append(asyncio.to_thread(self.voice_manager.get_available_voices, self.output_language))
+        client = self.translation_service.aclient
+        if client is not None:
+            steps.append(client.models.retrieve(self.translation_service.translation_model))
+        
+        results = await asyncio.gather(*steps, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Client warm-up step failed: {result}")
+        logger.info(f"Warmed up {sum(not isinstance(r, Exception) for r in results)}/{len(steps)} provider connections")
+    
     def _sync_language_settings(self):
         """Sync language settings across all services"""
         try:
@@ -58,6 +90,10 @@ class AudioCoordinator:
         """Translate text to the target language using OpenAI's API with gender awareness"""
         return self.translation_service.translate_text(text, target_language, gender)
     
+    async def atranslate_text(self, text: str, target_language: str, gender: str = "neutral") -> str:
+        """Translate text without blocking the event loop"""
+        return await self.translation_service.atranslate_text(text, target_language, gender)
+    
     # =============================================================================
     # SPEECH-TO-TEXT METHODS (maintain backward compatibility)
     # =============================================================================
@@ -75,8 +111,13 @@ class AudioCoordinator:
         # If user selected non-English language, they likely spoke in that language
         # We need to translate their input TO English for medical processing
         if current_language != "english" and transcript and transcript not in ["Ambiguous sound.", "Language not supported.", "Invalid audio format.", "Audio too short.", "Audio too long."]:
+            # Non-Latin-script languages come back in their own script, so an
+            # all-ASCII transcript is already English and needs no translation
+            if transcript.isascii() and not self.language_manager.uses_latin_script(current_language):
+                return transcript
+            
             # User spoke in their native language, translate to English for processing
-            english_text = self.translation_service.translate_text(transcript, "english")
+            english_text = await self.translation_service.atranslate_text(transcript, "english")
             return english_text
         else:
             # User spoke in English or there was an error
@@ -99,15 +140,25 @@ class AudioCoordinator:
             gender = self.translation_service.detect_gender_from_voice_id(self.tts_service.selected_voice)
             
             # Define gender-aware translator function for TTS service
-            def gender_aware_translator(text: str, target_language: str, gender: str) -> str:
-                return self.translation_service.translate_text(text, target_language, gender)
+            async def gender_aware_translator(text: str, target_language: str, gender: str) -> str:
+                return await self.translation_service.atranslate_text(text, target_language, gender)
             
-            return await self.tts_service.text_to_speech(text, speed, gender_aware_translator)
+            return await self.tts_service.text_to_speech_b64(text, speed, gender_aware_translator)
             
         except Exception as e:
             logger.error(f"Text-to-speech error: {e}")
             return ""
     
+    def speculative_text_to_speech(self, text: str, speed: float = None) -> "asyncio.Task[str]":
+        """
+        Start synthesizing text in the background and return the task
+        
+        For replies known before the work that precedes them finishes (fixed
+        messages that don't depend on a transcript or an LLM result), so the
+        TTS round-trip overlaps that work. Await the task for the base64 audio.
+        """
+        return asyncio.create_task(self.text_to_speech(text, speed))
+    
     # =============================================================================
     # AUDIO VALIDATION METHODS (maintain backward compatibility)
     # =============================================================================
@@ -126,12 +177,21 @@ class AudioCoordinator:
     
     def get_available_voices(self, language: str = None) -> Dict[str, List[Dict]]:
         """Get list of available Google TTS voices for a language"""
-        return self.voice_manager.get_available_voices(language)
+        voices = self.voice_manager.get_available_voices(language)
+        return {gender: [voice.to_dict() for voice in entries] for gender, entries in voices.items()}
+    
+    async def aget_available_voices(self, language: str = None) -> Dict[str, List[Dict]]:
+        """Get available Google TTS voices without blocking the event loop on a list_voices call"""
+        return await asyncio.to_thread(self.get_available_voices, language)
     
     async def play_voice_preview(self, voice_id: str, text: str = None, language: str = "english", gender: str = "neutral", speed: float = 1.0) -> str:
         """Generate voice preview using Google TTS"""
         return await self.voice_manager.generate_voice_preview(voice_id, text, language, speed)
     
+    async def warm_preview_cache(self) -> int:
+        """Pre-translate the default voice preview phrases for every language"""
+        return await self.voice_manager.warm_preview_translations()
+    
     # =============================================================================
     # LANGUAGE AND SETTINGS METHODS (maintain backward compatibility)
     # =============================================================================
@@ -1,8 +1,112 @@
+import asyncio
 import base64
+import binascii
 import logging
+import struct
+from typing import Optional, Union
+
+try:
+    import pybase64  # SIMD-accelerated base64, preferred when installed
+except ImportError:
+    pybase64 = None
 
 logger = logging.getLogger(__name__)
 
+# Container magic numbers: WebM/Matroska (EBML) and Ogg (Opus can be in Ogg container)
+_AUDIO_MAGICS = frozenset({b'\x1a\x45\xdf\xa3', b'OggS'})
+
+# Payloads at least this long are base64-coded in a worker thread; below it the
+# thread hop costs more than the encode/decode itself
+_B64_OFFLOAD_THRESHOLD = 256 * 1024
+
+# Matroska element IDs walked to reach Tracks/TrackEntry/Audio/SamplingFrequency
+_EBML_SEGMENT = 0x18538067
+_EBML_TRACKS = 0x1654AE6B
+_EBML_TRACK_ENTRY = 0xAE
+_EBML_AUDIO = 0xE1
+_EBML_SAMPLING_FREQUENCY = 0xB5
+_EBML_CLUSTER = 0x1F43B675
+_EBML_MASTERS = frozenset({_EBML_SEGMENT, _EBML_TRACKS, _EBML_TRACK_ENTRY, _EBML_AUDIO})
+
+def _read_ebml_vint(data: bytes, pos: int, keep_marker: bool) -> tuple[Optional[int], int]:
+    """Read an EBML variable-length integer, returning (value, new_pos)"""
+    first = data[pos]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8 or pos + length > len(data):
+        raise ValueError("Invalid EBML variable-length integer")
+    
+    value = first if keep_marker else first & (mask - 1)
+    unknown = value == mask - 1
+    for byte in data[pos + 1:pos + length]:
+        value = (value << 8) | byte
+        unknown = unknown and byte == 0xFF
+    
+    # An all-ones size means "unknown size" (used by live WebM streams)
+    if not keep_marker and unknown:
+        return None, pos + length
+    return value, pos + length
+
+def _parse_webm_sample_rate(audio_bytes: bytes) -> Optional[int]:
+    """Read SamplingFrequency from the first audio TrackEntry of a WebM/Matroska stream"""
+    pos = 0
+    end = len(audio_bytes)
+    
+    while pos < end:
+        element_id, pos = _read_ebml_vint(audio_bytes, pos, keep_marker=True)
+        size, pos = _read_ebml_vint(audio_bytes, pos, keep_marker=False)
+        
+        if element_id == _EBML_SAMPLING_FREQUENCY and size in (4, 8):
+            fmt = '>f' if size == 4 else '>d'
+            (rate,) = struct.unpack(fmt, audio_bytes[pos:pos + size])
+            return int(rate) if rate > 0 else None
+        
+        if element_id in _EBML_MASTERS:
+            # Descend into the master element's children
+            continue
+        
+        if element_id == _EBML_CLUSTER or size is None:
+            # Track metadata always precedes the media clusters
+            return None
+        
+        pos += size
+    
+    return None
+
+def _parse_ogg_sample_rate(audio_bytes: bytes) -> Optional[int]:
+    """Read the input sample rate from the OpusHead packet of an Ogg stream (RFC 7845)"""
+    if len(audio_bytes) < 27:
+        return None
+    
+    # First page: 27-byte header followed by the segment table
+    segment_count = audio_bytes[26]
+    packet_start = 27 + segment_count
+    packet = audio_bytes[packet_start:packet_start + 19]
+    if len(packet) < 16 or packet[:8] != b'OpusHead':
+        return None
+    
+    (rate,) = struct.unpack_from('<I', packet, 12)
+    return rate or None
+
+def _b64decode(data: Union[str, bytes], validate: bool = False) -> bytes:
+    """Decode base64 via pybase64 or the native binascii entry point"""
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=validate)
+    if validate:
+        # Rejects characters outside the base64 alphabet instead of skipping them
+        return base64.b64decode(data, validate=True)
+    # binascii accepts ASCII str directly and raises binascii.Error on bad padding
+    return binascii.a2b_base64(data)
+
+def _b64encode(data: bytes) -> str:
+    """Encode bytes to a base64 str via pybase64 when available"""
+    if pybase64 is not None:
+        return pybase64.b64encode(data).decode('ascii')
+    return base64.b64encode(data).decode('ascii')
+
 class AudioUtils:
     """Utility functions for audio format handling and validation"""
     
@@ -21,41 +125,58 @@ class AudioUtils:
             if not audio_data or len(audio_data) == 0:
                 return False
                 
-            audio_bytes = base64.b64decode(audio_data)
+            # Bound the decoded size from the base64 length without decoding
+            decoded_size = AudioUtils.estimate_decoded_size(audio_data)
             
             # Check if audio data is reasonable size
-            if len(audio_bytes) < 1000:  # At least 1KB
+            if decoded_size < 1000:  # At least 1KB
                 return False
                 
             # Check if audio data is not too large (10MB limit)
-            if len(audio_bytes) > 10 * 1024 * 1024:
+            if decoded_size > 10 * 1024 * 1024:
                 return False
                 
-            # Basic WebM/Opus header check
-            if audio_bytes[:4] == b'\x1a\x45\xdf\xa3':  # WebM header
-                return True
-            elif audio_bytes[:4] == b'OggS':  # Ogg header (Opus can be in Ogg container)
+            # Basic WebM/Ogg header check, decoding only the first 8 characters
+            header = _b64decode(audio_data[:8])[:4]
+            if header in _AUDIO_MAGICS:
                 return True
-            else:
-                return True  # Allow other formats, let Google STT handle validation
+            return True  # Allow other formats, let Google STT handle validation
                 
         except Exception as e:
             logger.error(f"Audio format validation error: {e}")
             return False
     
     @staticmethod
-    def base64_to_bytes(audio_data: str) -> bytes:
+    def estimate_decoded_size(audio_data: str) -> int:
+        """
+        Compute the decoded byte size of base64 data from its length
+        
+        Args:
+            audio_data: Base64 encoded audio data
+            
+        Returns:
+            int: Number of bytes the data decodes to
+        """
+        padding = audio_data[-2:].count('=')
+        return (len(audio_data) * 3) // 4 - padding
+    
+    @staticmethod
+    def base64_to_bytes(audio_data: str, validate: bool = False) -> bytes:
         """
         Convert base64 audio data to bytes
         
         Args:
             audio_data: Base64 encoded audio data
+            validate: Reject non-alphabet characters instead of discarding them
             
         Returns:
             bytes: Decoded audio bytes
+            
+        Raises:
+            binascii.Error: If the data is not valid base64
         """
         try:
-            return base64.b64decode(audio_data)
+            return _b64decode(audio_data, validate=validate)
         except Exception as e:
             logger.error(f"Base64 decode error: {e}")
             raise
@@ -71,7 +192,21 @@ class AudioUtils:
         Returns:
             str: Base64 encoded audio data
         """
-        return base64.b64encode(audio_bytes).decode('utf-8')
+        return _b64encode(audio_bytes)
+    
+    @staticmethod
+    async def abase64_to_bytes(audio_data: str, validate: bool = False) -> bytes:
+        """base64_to_bytes that decodes large payloads in a worker thread"""
+        if len(audio_data) < _B64_OFFLOAD_THRESHOLD:
+            return AudioUtils.base64_to_bytes(audio_data, validate)
+        return await asyncio.to_thread(AudioUtils.base64_to_bytes, audio_data, validate)
+    
+    @staticmethod
+    async def abytes_to_base64(audio_bytes: bytes) -> str:
+        """bytes_to_base64 that encodes large payloads in a worker thread"""
+        if len(audio_bytes) < _B64_OFFLOAD_THRESHOLD:
+            return _b64encode(audio_bytes)
+        return await asyncio.to_thread(_b64encode, audio_bytes)
     
     @staticmethod
     def check_audio_duration(audio_bytes: bytes) -> tuple[bool, str]:
@@ -106,5 +241,26 @@ class AudioUtils:
         Returns:
             bytes: Audio blob data
         """
-        byte_characters = base64.b64decode(base64_data)
-        return byte_characters 
\ No newline at end of file
+        byte_characters = _b64decode(base64_data)
+        return byte_characters 
+    
+    @staticmethod
+    def detect_sample_rate(audio_bytes: bytes) -> Optional[int]:
+        """
+        Read the sample rate declared in the audio container header
+        
+        Args:
+            audio_bytes: Raw WebM or Ogg audio bytes
+            
+        Returns:
+            int: Sample rate in Hz, or None if it cannot be determined
+        """
+        try:
+            header = bytes(audio_bytes[:4])
+            if header == b'\x1a\x45\xdf\xa3':
+                return _parse_webm_sample_rate(audio_bytes)
+            if header == b'OggS':
+                return _parse_ogg_sample_rate(audio_bytes)
+        except (ValueError, IndexError, struct.error) as e:
+            logger.debug("Could not parse container sample rate: %s", e)
+        return None
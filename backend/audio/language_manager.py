@@ -1,104 +1,141 @@
+import functools
 import logging
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, Mapping, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+class LanguageSpec(NamedTuple):
+    """A supported language: internal code, display name and Google STT code"""
+    code: str
+    display: str
+    google_code: str
+
+# Supported languages - Indian languages + Top 15 World languages.
+# Single source of truth; the lookup tables below are derived from it.
+_LANGUAGES = (
+    # Indian languages
+    LanguageSpec("english", "English", "en-US"),
+    LanguageSpec("hindi", "Hindi", "hi-IN"),
+    LanguageSpec("bengali", "Bengali", "bn-IN"),
+    LanguageSpec("telugu", "Telugu", "te-IN"),
+    LanguageSpec("marathi", "Marathi", "mr-IN"),
+    LanguageSpec("tamil", "Tamil", "ta-IN"),
+    LanguageSpec("gujarati", "Gujarati", "gu-IN"),
+    LanguageSpec("urdu", "Urdu", "ur-IN"),  # Use India variant as supported by Google Cloud STT
+    LanguageSpec("kannada", "Kannada", "kn-IN"),
+    # Top 15 World languages
+    LanguageSpec("mandarin", "Chinese (Mandarin)", "zh-CN"),
+    LanguageSpec("spanish", "Spanish", "es-ES"),
+    LanguageSpec("french", "French", "fr-FR"),
+    LanguageSpec("arabic", "Arabic", "ar-XA"),
+    LanguageSpec("portuguese", "Portuguese", "pt-BR"),
+    LanguageSpec("russian", "Russian", "ru-RU"),
+    LanguageSpec("japanese", "Japanese", "ja-JP"),
+    LanguageSpec("german", "German", "de-DE"),
+    LanguageSpec("korean", "Korean", "ko-KR"),
+    LanguageSpec("italian", "Italian", "it-IT"),
+    LanguageSpec("turkish", "Turkish", "tr-TR"),
+    LanguageSpec("vietnamese", "Vietnamese", "vi-VN"),
+    LanguageSpec("thai", "Thai", "th-TH"),
+    LanguageSpec("indonesian", "Indonesian", "id-ID"),
+    LanguageSpec("dutch", "Dutch", "nl-NL"),
+)
+
+_LANGUAGES_BY_CODE = {spec.code: spec for spec in _LANGUAGES}
+
+_SUPPORTED_LANGUAGES = tuple(_LANGUAGES_BY_CODE)
+
+# Language mapping for proper names
+_LANGUAGE_MAPPING = {spec.code: spec.display for spec in _LANGUAGES}
+
+# Google Speech-to-Text language mapping
+_GOOGLE_LANGUAGE_MAPPING = {spec.code: spec.google_code for spec in _LANGUAGES}
+
+# Language-specific confidence thresholds for STT
+_CONFIDENCE_THRESHOLDS = MappingProxyType({
+    "en-US": 0.20,  # More lenient for Indian accents in English
+    "en-IN": 0.20,  # Indian English baseline
+    "ur-IN": 0.4,   # Urdu needs higher confidence
+    "ar-XA": 0.35,  # Arabic needs higher confidence  
+    "bn-IN": 0.35,  # Bengali needs higher confidence
+    "ta-IN": 0.35,  # Tamil needs higher confidence
+    "te-IN": 0.35,  # Telugu needs higher confidence
+    "kn-IN": 0.35,  # Kannada needs higher confidence
+    "gu-IN": 0.35,  # Gujarati needs higher confidence
+    "mr-IN": 0.35,  # Marathi needs higher confidence
+})
+
+# Languages that support latest_short model (limited set)
+_LATEST_SHORT_SUPPORTED = frozenset({
+    "en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "it-IT", 
+    "ja-JP", "ko-KR", "pt-BR", "ru-RU", "hi-IN", "zh-CN"
+})
+
+# Languages written in Latin script; Google STT transcribes the others in their
+# native script, so an all-ASCII transcript there means the user spoke English
+_LATIN_SCRIPT_LANGUAGES = frozenset({
+    "english", "spanish", "french", "portuguese", "german",
+    "italian", "turkish", "vietnamese", "indonesian", "dutch"
+})
+
+@functools.lru_cache(maxsize=64)
+def _normalize_language(language: str) -> Optional[str]:
+    """Lower-case a language code, returning None if it is not supported"""
+    normalized = language.lower()
+    return normalized if normalized in _LANGUAGES_BY_CODE else None
+
+@functools.lru_cache(maxsize=64)
+def _google_language_code(language: str) -> str:
+    """Map a language code to its Google STT language code"""
+    return _GOOGLE_LANGUAGE_MAPPING.get(language.lower(), "en-US")
+
+@functools.lru_cache(maxsize=64)
+def _stt_language_config(current_language: str) -> Mapping:
+    """Build (and cache) the read-only STT configuration for a lower-cased language code"""
+    target_language_code = _google_language_code(current_language)
+    
+    if current_language == "english":
+        # When English is selected, use US English as primary for speed, Indian English as alternative
+        primary_language = "en-US"
+        alternative_languages = ("en-IN",)  # Indian English for accent recognition
+    elif current_language == "hindi":
+        # When Hindi is selected, use Hindi as primary for speed, Indian English as alternative
+        primary_language = "hi-IN"
+        alternative_languages = ("en-IN",)  # Indian English for accent recognition
+    elif current_language == "urdu":
+        # Special handling for Urdu: use Hindi as alternative since they share phonetics
+        primary_language = target_language_code  # ur-IN
+        alternative_languages = ("hi-IN", "en-US")  # Hindi and English as alternatives
+    else:
+        # When non-English is selected, use that language as primary and English as fallback
+        primary_language = target_language_code
+        alternative_languages = ("en-US",)  # Both US and Indian English
+    
+    # Use appropriate model based on language support
+    model_to_use = "latest_short" if primary_language in _LATEST_SHORT_SUPPORTED else "default"
+    
+    return MappingProxyType({
+        "primary_language": primary_language,
+        "alternative_languages": alternative_languages,
+        "model": model_to_use,
+        "confidence_threshold": _CONFIDENCE_THRESHOLDS.get(primary_language, 0.25)
+    })
+
 class LanguageManager:
     """Service for managing languages, mappings, and validation"""
     
     def __init__(self):
-        # Supported languages - Indian languages + Top 15 World languages
-        self.supported_languages = [
-            # Indian languages
-            "english", "hindi", "bengali", "telugu", "marathi", 
-            "tamil", "gujarati", "urdu", "kannada",
-            # Top 15 World languages
-            "mandarin", "spanish", "french", "arabic", "portuguese", 
-            "russian", "japanese", "german", "korean", "italian", 
-            "turkish", "vietnamese", "thai", "indonesian", "dutch"
-        ]
-        
-        # Language mapping for proper names
-        self.language_mapping = {
-            # Indian languages
-            "english": "English",
-            "hindi": "Hindi", 
-            "bengali": "Bengali",
-            "telugu": "Telugu", 
-            "marathi": "Marathi",
-            "tamil": "Tamil",
-            "gujarati": "Gujarati",
-            "urdu": "Urdu",
-            "kannada": "Kannada",
-            # World languages
-            "mandarin": "Chinese (Mandarin)",
-            "spanish": "Spanish",
-            "french": "French",
-            "arabic": "Arabic",
-            "portuguese": "Portuguese",
-            "russian": "Russian",
-            "japanese": "Japanese",
-            "german": "German",
-            "korean": "Korean",
-            "italian": "Italian",
-            "turkish": "Turkish",
-            "vietnamese": "Vietnamese",
-            "thai": "Thai",
-            "indonesian": "Indonesian",
-            "dutch": "Dutch"
-        }
-        
-        # Google Speech-to-Text language mapping
-        self.google_language_mapping = {
-            "english": "en-US",
-            "hindi": "hi-IN", 
-            "bengali": "bn-IN",
-            "telugu": "te-IN",
-            "marathi": "mr-IN",
-            "tamil": "ta-IN",
-            "gujarati": "gu-IN",
-            "urdu": "ur-IN",  # Use India variant as supported by Google Cloud STT
-            "kannada": "kn-IN",
-            "mandarin": "zh-CN",
-            "spanish": "es-ES",
-            "french": "fr-FR",
-            "arabic": "ar-XA",
-            "portuguese": "pt-BR",
-            "russian": "ru-RU",
-            "japanese": "ja-JP",
-            "german": "de-DE",
-            "korean": "ko-KR",
-            "italian": "it-IT",
-            "turkish": "tr-TR",
-            "vietnamese": "vi-VN",
-            "thai": "th-TH",
-            "indonesian": "id-ID",
-            "dutch": "nl-NL"
-        }
-        
-        # Language-specific confidence thresholds for STT
-        self.confidence_thresholds = {
-            "en-US": 0.20,  # More lenient for Indian accents in English
-            "en-IN": 0.20,  # Indian English baseline
-            "ur-IN": 0.4,   # Urdu needs higher confidence
-            "ar-XA": 0.35,  # Arabic needs higher confidence  
-            "bn-IN": 0.35,  # Bengali needs higher confidence
-            "ta-IN": 0.35,  # Tamil needs higher confidence
-            "te-IN": 0.35,  # Telugu needs higher confidence
-            "kn-IN": 0.35,  # Kannada needs higher confidence
-            "gu-IN": 0.35,  # Gujarati needs higher confidence
-            "mr-IN": 0.35,  # Marathi needs higher confidence
-        }
-        
-        # Languages that support latest_short model (limited set)
-        self.latest_short_supported = [
-            "en-US", "en-GB", "es-ES", "fr-FR", "de-DE", "it-IT", 
-            "ja-JP", "ko-KR", "pt-BR", "ru-RU", "hi-IN", "zh-CN"
-        ]
+        # Language tables are process-wide constants; instances share them
+        self.supported_languages = _SUPPORTED_LANGUAGES
+        self.language_mapping = _LANGUAGE_MAPPING
+        self.google_language_mapping = _GOOGLE_LANGUAGE_MAPPING
+        self.confidence_thresholds = _CONFIDENCE_THRESHOLDS
+        self.latest_short_supported = _LATEST_SHORT_SUPPORTED
     
     def is_language_supported(self, language: str) -> bool:
         """Check if a language is supported"""
-        return language.lower() in self.supported_languages
+        return _normalize_language(language) is not None
     
     def get_language_display_name(self, language_code: str) -> str:
         """Get display name for a language code"""
@@ -106,7 +143,7 @@ class LanguageManager:
     
     def get_google_language_code(self, language: str) -> str:
         """Get Google STT language code for a language"""
-        return self.google_language_mapping.get(language.lower(), "en-US")
+        return _google_language_code(language)
     
     def get_confidence_threshold(self, google_language_code: str) -> float:
         """Get confidence threshold for a Google language code"""
@@ -116,7 +153,11 @@ class LanguageManager:
         """Check if language supports Google's latest_short model"""
         return google_language_code in self.latest_short_supported
     
-    def get_stt_language_config(self, language: str) -> Dict:
+    def uses_latin_script(self, language: str) -> bool:
+        """Check if a language is written in Latin script"""
+        return language.lower() in _LATIN_SCRIPT_LANGUAGES
+    
+    def get_stt_language_config(self, language: str) -> Mapping:
         """
         Get complete STT configuration for a language
         
@@ -124,44 +165,13 @@ class LanguageManager:
             language: Language code (e.g., 'english', 'hindi')
             
         Returns:
-            dict: STT configuration including primary language, alternatives, model, etc.
+            Mapping: Read-only STT configuration including primary language, alternatives, model, etc.
         """
-        current_language = language.lower()
-        target_language_code = self.get_google_language_code(current_language)
-        
-        if current_language == "english":
-            # When English is selected, use US English as primary for speed, Indian English as alternative
-            primary_language = "en-US"
-            alternative_languages = ["en-IN"]  # Indian English for accent recognition
-        elif current_language == "hindi":
-            # When Hindi is selected, use Hindi as primary for speed, Indian English as alternative
-            primary_language = "hi-IN"
-            alternative_languages = ["en-IN"]  # Indian English for accent recognition
-        elif current_language == "urdu":
-            # Special handling for Urdu: use Hindi as alternative since they share phonetics
-            primary_language = target_language_code  # ur-IN
-            alternative_languages = ["hi-IN", "en-US"]  # Hindi and English as alternatives
-        else:
-            # When non-English is selected, use that language as primary and English as fallback
-            primary_language = target_language_code
-            alternative_languages = ["en-US"]  # Both US and Indian English
-        
-        # Use appropriate model based on language support
-        model_to_use = "latest_short" if self.supports_latest_short_model(primary_language) else "default"
-        
-        return {
-            "primary_language": primary_language,
-            "alternative_languages": alternative_languages,
-            "model": model_to_use,
-            "confidence_threshold": self.get_confidence_threshold(primary_language)
-        }
+        return _stt_language_config(language.lower())
     
     def get_supported_languages_list(self) -> List[Dict[str, str]]:
         """Get list of supported languages for API responses"""
-        return [
-            {"code": code, "name": self.get_language_display_name(code)}
-            for code in self.supported_languages
-        ]
+        return [{"code": spec.code, "name": spec.display} for spec in _LANGUAGES]
     
     def validate_and_normalize_language(self, language: str) -> str:
         """
@@ -173,8 +183,8 @@ class LanguageManager:
         Returns:
             str: Normalized language code, defaults to 'english' if invalid
         """
-        normalized = language.lower()
-        if normalized not in self.supported_languages:
-            logger.warning(f"Unsupported language: {language}. Defaulting to English.")
+        normalized = _normalize_language(language)
+        if normalized is None:
+            logger.warning("Unsupported language: %s. Defaulting to English.", language)
             return "english"
         return normalized 
\ No newline at end of file
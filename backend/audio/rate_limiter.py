@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """
+    Token-bucket throttle for requests-per-minute and tokens-per-minute limits.
+
+    Capacity refills continuously at limit/60 per second. Callers wait until
+    both buckets can cover the request, so bursts are smoothed before they
+    trigger 429 responses and the retry/backoff that follows.
+    """
+
+    def __init__(self, max_requests_per_minute: Optional[float] = None, max_tokens_per_minute: Optional[float] = None):
+        self.max_requests_per_minute = max_requests_per_minute or float(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "500"))
+        self.max_tokens_per_minute = max_tokens_per_minute or float(os.getenv("OPENAI_MAX_TOKENS_PER_MINUTE", "200000"))
+
+        self.available_request_capacity = self.max_requests_per_minute
+        self.available_token_capacity = self.max_tokens_per_minute
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self.available_request_capacity = min(
+            self.max_requests_per_minute,
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60.0
+        )
+        self.available_token_capacity = min(
+            self.max_tokens_per_minute,
+            self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60.0
+        )
+
+    def _try_consume(self, tokens: int) -> float:
+        """Consume capacity if available, otherwise return the seconds to wait"""
+        # A single request larger than the whole bucket would otherwise wait forever
+        tokens = min(tokens, self.max_tokens_per_minute)
+        with self._lock:
+            self._refill()
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0.0
+
+            request_wait = max(0.0, 1 - self.available_request_capacity) * 60.0 / self.max_requests_per_minute
+            token_wait = max(0.0, tokens - self.available_token_capacity) * 60.0 / self.max_tokens_per_minute
+            return max(request_wait, token_wait, 0.001)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait (asynchronously) until a request costing `tokens` may be sent"""
+        while True:
+            wait = self._try_consume(tokens)
+            if not wait:
+                return
+            logger.debug("Rate limiter waiting %.3fs for %d tokens", wait, tokens)
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """Blocking variant of acquire for synchronous callers"""
+        while True:
+            wait = self._try_consume(tokens)
+            if not wait:
+                return
+            logger.debug("Rate limiter waiting %.3fs for %d tokens", wait, tokens)
+            time.sleep(wait)
+
+_encodings = {}
+
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded"""
+    if model not in _encodings:
+        try:
+            try:
+                _encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                _encodings[model] = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            # Vocabulary files are downloaded on first use; remember failures
+            # so offline hosts don't retry the download on every request
+            logger.warning(f"tiktoken encoding unavailable for {model}, using estimate: {e}")
+            _encodings[model] = None
+    return _encodings[model]
+
+def estimate_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """Estimate the token count of text, using tiktoken when it is installed"""
+    encoding = _get_encoding(model) if tiktoken is not None else None
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # Rough fallback: ~4 characters per token for English text
+    return len(text) // 4 + 1
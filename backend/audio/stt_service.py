@@ -1,12 +1,48 @@
-import base64
+import asyncio
+import binascii
+import functools
 import logging
 import os
+import threading
 from typing import Optional
 from .language_manager import LanguageManager
 from .audio_utils import AudioUtils
 
 logger = logging.getLogger(__name__)
 
+try:
+    from google.cloud import speech
+    _WEBM_OPUS_ENCODING = speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
+except ImportError:
+    logger.error("google-cloud-speech is not installed; Google Speech-to-Text is unavailable")
+    speech = None
+    _WEBM_OPUS_ENCODING = None
+
+# Chunk size for streaming_recognize requests
+_STREAM_CHUNK_SIZE = 8 * 1024
+
+# Sample rates tried in order when recognition fails; prioritize 48kHz
+_DEFAULT_SAMPLE_RATES = (48000, 16000, 24000, 44100)
+
+@functools.lru_cache(maxsize=16)
+def _build_config(primary_language: str, alternative_languages: tuple, model: str,
+                  sample_rate: int, max_alternatives: int, profanity_filter: bool):
+    """Build (and cache) a WEBM_OPUS RecognitionConfig for the given settings"""
+    return speech.RecognitionConfig(
+        encoding=_WEBM_OPUS_ENCODING,
+        sample_rate_hertz=sample_rate,
+        language_code=primary_language,
+        alternative_language_codes=list(alternative_languages),
+        
+        # Optimized for speed + accent recognition
+        use_enhanced=True,  # Better for accented speech
+        enable_automatic_punctuation=False,
+        enable_word_confidence=True,
+        model=model,
+        max_alternatives=max_alternatives,
+        profanity_filter=profanity_filter,
+    )
+
 class STTService:
     """Service for Speech-to-Text conversion using Google Cloud STT"""
     
@@ -26,8 +62,50 @@ class STTService:
         # Validate language
         self.output_language = self.language_manager.validate_and_normalize_language(self.output_language)
         
+        # Google STT client, created lazily and reused across requests
+        self._speech_client = None
+        self._client_lock = threading.Lock()
+        
+        # Run the English en-IN fallback concurrently with en-US instead of after it;
+        # off by default since it doubles Google STT calls for English sessions
+        self.speculative_fallback = os.getenv("STT_SPECULATIVE_FALLBACK", "false").lower() == "true"
+        
+        # Let Google pick between the session language and its alternatives; with
+        # this off only the session language is recognized, skipping language
+        # identification (English sessions keep the separate en-IN fallback)
+        self.alternative_languages = os.getenv("STT_ALTERNATIVE_LANGUAGES", "true").lower() == "true"
+        
+        # Send audio through streaming_recognize instead of one recognize request
+        self.streaming_recognize = os.getenv("STT_STREAMING_RECOGNIZE", "false").lower() == "true"
+        
+        # Caps concurrent recognize calls (and their worker threads) across sessions
+        self._recognize_semaphore = asyncio.Semaphore(int(os.getenv("GOOGLE_CONCURRENCY", "10")))
+        
         logger.info(f"STT Service initialized with output language: {self.output_language}")
     
+    def get_client(self):
+        """Get the shared Google STT client, creating it on first use"""
+        if self._speech_client is None:
+            # Startup warm-up and the first request may race to build it
+            with self._client_lock:
+                if self._speech_client is None:
+                    if speech is None:
+                        raise Exception("google-cloud-speech package not installed")
+                    self._speech_client = speech.SpeechClient()
+        return self._speech_client
+    
+    def close(self) -> None:
+        """Close the shared Google STT client's gRPC channel"""
+        if self._speech_client is not None:
+            self._speech_client.transport.close()
+            self._speech_client = None
+    
+    async def _ensure_client(self):
+        """Get the shared Google STT client, building it off the event loop on first use"""
+        if self._speech_client is None:
+            return await asyncio.to_thread(self.get_client)
+        return self._speech_client
+    
     async def speech_to_text(self, audio_data: str, target_language: Optional[str] = None) -> str:
         """
         Convert base64 encoded audio to text using Google STT
@@ -49,7 +127,7 @@ class STTService:
         
         # Check if target language is supported by Google
         if not self.language_manager.is_language_supported(current_language):
-            logger.warning(f"Target language {current_language} not supported")
+            logger.warning("Target language %s not supported", current_language)
             return "Language not supported."
         
         # Use Google Speech-to-Text
@@ -61,118 +139,161 @@ class STTService:
             raise Exception("Google Speech-to-Text credentials not configured")
             
         try:
-            # Decode and validate audio data
-            audio_bytes = AudioUtils.base64_to_bytes(audio_data)
-            
-            # Check audio duration
-            is_valid, error_msg = AudioUtils.check_audio_duration(audio_bytes)
-            if not is_valid:
-                return error_msg
+            # Decode audio data; size bounds were already enforced from the
+            # base64 length by validate_audio_format
+            try:
+                audio_bytes = await AudioUtils.abase64_to_bytes(audio_data, validate=True)
+            except (binascii.Error, ValueError):
+                return "Invalid audio format."
             
             # Google STT setup
-            from google.cloud import speech
-            client = speech.SpeechClient()
+            client = await self._ensure_client()
             
             # Get language configuration from language manager
             lang_config = self.language_manager.get_stt_language_config(current_language)
             
-            # Try multiple sample rates if first attempt fails
-            sample_rates = [48000, 16000, 24000, 44100]  # Common rates, prioritize 48kHz
+            # Build the audio payload once; it is shared by every recognize attempt.
+            # Streaming sends chunks of audio_bytes instead, so skip the protobuf copy.
+            audio = None if self.streaming_recognize else speech.RecognitionAudio(content=audio_bytes)
+            
+            # Try the container's declared sample rate first when available, then
+            # the common rates if an attempt fails (e.g. an OpusHead input rate of
+            # 44100 for a stream Google must decode at 48000)
+            sample_rates = list(_DEFAULT_SAMPLE_RATES)
+            detected_rate = AudioUtils.detect_sample_rate(audio_bytes)
+            if detected_rate:
+                sample_rates = [detected_rate] + [rate for rate in sample_rates if rate != detected_rate]
+            
+            # English is recognized as en-US first, with en-IN as a fallback for low confidence
+            use_en_in_fallback = current_language == "english" and lang_config["primary_language"] == "en-US"
+            
+            # Speculate only at a sample rate read from the container header, and
+            # only on that first attempt; retries at guessed rates start en-IN lazily
+            speculate = use_en_in_fallback and self.speculative_fallback and detected_rate is not None
             
             for sample_rate in sample_rates:
+                fallback_task = None
                 try:
-                    config = speech.RecognitionConfig(
-                        encoding=speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-                        sample_rate_hertz=sample_rate,
-                        language_code=lang_config["primary_language"],
-                        alternative_language_codes=lang_config["alternative_languages"],
-                        
-                        # Optimized for speed + accent recognition
-                        use_enhanced=True,  # Better for accented speech
-                        enable_automatic_punctuation=False,
-                        enable_word_confidence=True,
-                        model=lang_config["model"],  # Use language-appropriate model
+                    config = _build_config(
+                        lang_config["primary_language"],
+                        lang_config["alternative_languages"] if self.alternative_languages else (),
+                        lang_config["model"],  # Use language-appropriate model
+                        sample_rate,
                         max_alternatives=3,  # Get backup for accents
                         profanity_filter=False,
                     )
                     
-                    # Perform recognition
-                    audio = speech.RecognitionAudio(content=audio_bytes)
-                    response = client.recognize(config=config, audio=audio)
+                    # Start the en-IN fallback alongside en-US so a low-confidence
+                    # result doesn't cost a second sequential round-trip
+                    if speculate and sample_rate == detected_rate:
+                        fallback_task = self._start_en_in_fallback(client, audio, audio_bytes, sample_rate)
+                    
+                    # Perform recognition in a worker thread so other sessions keep running
+                    results = await self._recognize_async(client, config, audio, audio_bytes)
                     
                     # Handle results
-                    if not response.results:
+                    if not results:
                         if sample_rate == sample_rates[-1]:  # Last attempt
                             return "Ambiguous sound."
                         continue  # Try next sample rate
                         
-                    result = response.results[0]
+                    result = results[0]
                     transcript = result.alternatives[0].transcript.strip()
                     confidence = result.alternatives[0].confidence
                     
                     # Check confidence against language-specific thresholds
                     min_confidence = lang_config["confidence_threshold"]
                     
-                    # Special fallback for English: if en-US has low confidence, retry with en-IN as primary
-                    if (current_language == "english" and lang_config["primary_language"] == "en-US" and 
-                        (not transcript or confidence < 0.25)):  # Higher threshold for fallback trigger
+                    # Special fallback for English: if en-US has low confidence, use en-IN as primary
+                    if use_en_in_fallback and (not transcript or confidence < 0.25):  # Higher threshold for fallback trigger
                         
-                        logger.info(f"en-US low confidence ({confidence:.2f}), transcript: {transcript}, retrying with en-IN as primary")
+                        logger.debug("en-US low confidence (%.2f), transcript: %s, using en-IN as primary", confidence, transcript)
                         
-                        # Retry with en-IN as primary
-                        fallback_config = speech.RecognitionConfig(
-                            encoding=speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-                            sample_rate_hertz=sample_rate,  # Use the working sample rate
-                            language_code="en-IN",  # Indian English as primary
-                            alternative_language_codes=["en-US"],  # US English as fallback
-                            
-                            use_enhanced=True,
-                            enable_automatic_punctuation=False,
-                            enable_word_confidence=True,
-                            model="latest_short",  # en-IN supports latest_short
-                            max_alternatives=2,
-                            profanity_filter=True,
-                        )
+                        if fallback_task is None:
+                            fallback_task = self._start_en_in_fallback(client, audio, audio_bytes, sample_rate)
                         
                         try:
-                            fallback_response = client.recognize(config=fallback_config, audio=audio)
+                            fallback_results = await fallback_task
                             
-                            if fallback_response.results:
-                                fallback_result = fallback_response.results[0]
+                            if fallback_results:
+                                fallback_result = fallback_results[0]
                                 fallback_transcript = fallback_result.alternatives[0].transcript.strip()
                                 fallback_confidence = fallback_result.alternatives[0].confidence
                                 
-                                logger.info(f"en-IN fallback: confidence={fallback_confidence:.2f}, transcript='{fallback_transcript}'")
+                                logger.debug("en-IN fallback: confidence=%.2f, transcript=%r", fallback_confidence, fallback_transcript)
                                 
                                 # Use fallback result if it's better or original was too poor
                                 if fallback_confidence > confidence:
-                                    logger.info(f"Using en-IN result (better confidence: {fallback_confidence:.2f} > {confidence:.2f})")
+                                    logger.debug("Using en-IN result (better confidence: %.2f > %.2f)", fallback_confidence, confidence)
                                     return fallback_transcript
                                 elif not transcript and fallback_confidence >= 0.20:
-                                    logger.info(f"Using en-IN result (original failed, fallback confidence: {fallback_confidence:.2f})")
+                                    logger.debug("Using en-IN result (original failed, fallback confidence: %.2f)", fallback_confidence)
                                     return fallback_transcript
                                     
                         except Exception as e:
-                            logger.error(f"en-IN fallback failed: {e}")
+                            logger.error("en-IN fallback failed: %s", e)
                     
                     # Check confidence against thresholds
                     if not transcript or confidence < min_confidence:
-                        logger.info(f"Low confidence for {lang_config['primary_language']}: {confidence:.2f} < {min_confidence} - '{transcript}'")
+                        logger.debug("Low confidence for %s: %.2f < %s - %r", lang_config["primary_language"], confidence, min_confidence, transcript)
                         return "Ambiguous sound."
                     
                     # Success - return transcript
-                    logger.info(f"STT success: confidence={confidence:.2f}, transcript='{transcript}'")
+                    logger.debug("STT success: confidence=%.2f, transcript=%r", confidence, transcript)
                     return transcript
                     
                 except Exception as sample_rate_error:
                     if sample_rate == sample_rates[-1]:  # Last attempt
                         raise sample_rate_error
                     continue  # Try next sample rate
+                finally:
+                    # The en-US result was good enough; drop the speculative en-IN call
+                    if fallback_task is not None and not fallback_task.done():
+                        fallback_task.cancel()
                 
         except Exception as e:
-            logger.error(f"Google Speech-to-text error: {e}")
+            logger.error("Google Speech-to-text error: %s", e)
             return "Ambiguous sound."
     
+    def _recognize(self, client, config, audio, audio_bytes: bytes) -> list:
+        """
+        Run one blocking recognition request and return its final results
+        
+        With STT_STREAMING_RECOGNIZE enabled the payload is sent through
+        streaming_recognize in small chunks, so Google starts decoding while
+        the rest of the upload is still in flight.
+        """
+        if not self.streaming_recognize:
+            return list(client.recognize(config=config, audio=audio).results)
+        
+        streaming_config = speech.StreamingRecognitionConfig(config=config, interim_results=False)
+        requests = (
+            speech.StreamingRecognizeRequest(audio_content=audio_bytes[offset:offset + _STREAM_CHUNK_SIZE])
+            for offset in range(0, len(audio_bytes), _STREAM_CHUNK_SIZE)
+        )
+        responses = client.streaming_recognize(config=streaming_config, requests=requests)
+        return [result for response in responses for result in response.results if result.is_final]
+    
+    async def _recognize_async(self, client, config, audio, audio_bytes: bytes) -> list:
+        """Run _recognize in a worker thread, bounded by GOOGLE_CONCURRENCY"""
+        async with self._recognize_semaphore:
+            return await asyncio.to_thread(self._recognize, client, config, audio, audio_bytes)
+    
+    def _start_en_in_fallback(self, client, audio, audio_bytes: bytes, sample_rate: int) -> asyncio.Task:
+        """Start the en-IN recognize call used as the English fallback as a background task"""
+        fallback_config = _build_config(
+            "en-IN",  # Indian English as primary
+            ("en-US",),  # US English as fallback
+            "latest_short",  # en-IN supports latest_short
+            sample_rate,
+            max_alternatives=2,
+            profanity_filter=True,
+        )
+        task = asyncio.ensure_future(self._recognize_async(client, fallback_config, audio, audio_bytes))
+        # Consume errors from results that end up unused so they aren't reported as unhandled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+    
     def set_output_language(self, language: str) -> bool:
         """
         Set the output language for STT
@@ -185,10 +306,10 @@ class STTService:
         """
         normalized_language = self.language_manager.validate_and_normalize_language(language)
         if normalized_language != language.lower():
-            logger.warning(f"Language {language} normalized to {normalized_language}")
+            logger.warning("Language %s normalized to %s", language, normalized_language)
         
         self.output_language = normalized_language
-        logger.info(f"STT output language changed to: {self.output_language}")
+        logger.debug("STT output language changed to: %s", self.output_language)
         return True
     
     def get_supported_languages(self) -> list:
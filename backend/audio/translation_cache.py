@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk location, overridable with TRANSLATION_CACHE_DIR
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "clinical-trial-agent" / "translations"
+
+class TranslationCache:
+    """
+    Persistent SQLite-backed cache of translated strings.
+
+    A bounded in-memory LRU sits in front of SQLite so the phrases repeated
+    in every interview are served without a database query.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[int] = None,
+                 max_memory_entries: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or os.getenv("TRANSLATION_CACHE_DIR", _DEFAULT_CACHE_DIR))
+
+        # Entries older than the TTL are ignored on read and removed by evict_expired
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv("TRANSLATION_CACHE_TTL", str(30 * 24 * 3600)))
+        self.max_memory_entries = max_memory_entries if max_memory_entries is not None else int(os.getenv("TRANSLATION_CACHE_MEMORY_SIZE", "4096"))
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_dir / "translations.db"), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info(f"Translation cache ready at {self.cache_dir}")
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache disabled: {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(text: str, target_language: str, gender: str, model: str) -> str:
+        """Build the cache key for a translation request"""
+        return hashlib.sha256(f"{model}|{target_language}|{gender}|{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        """Insert into the memory LRU; the caller must hold the lock"""
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _get_memory(self, key: str) -> Optional[Tuple[str, float]]:
+        """Look up the memory LRU, returning (value, created_at) or None"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        return entry
+
+    def _get_persistent(self, key: str) -> Optional[Tuple[str, float]]:
+        """Look up SQLite (blocking), promoting a hit into the memory LRU"""
+        if self._conn is None:
+            return None
+
+        try:
+            with self._lock:
+                entry = self._conn.execute(
+                    "SELECT value, created_at FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+                if entry is not None:
+                    self._remember(key, *entry)
+            return entry
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache read error: {e}")
+            return None
+
+    def _get_persistent_many(self, keys: List[str]) -> Dict[str, Tuple[str, float]]:
+        """Look up several keys in SQLite (blocking)"""
+        entries = {}
+        for key in keys:
+            entry = self._get_persistent(key)
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def _fresh(self, entry: Optional[Tuple[str, float]]) -> Optional[str]:
+        """Return an entry's value unless it is missing or older than the TTL"""
+        if entry is None:
+            return None
+        value, created_at = entry
+        if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+            return None
+        return value
+
+    def _write_persistent(self, items: List[Tuple[str, str]], created_at: float) -> None:
+        """Write (key, value) pairs to SQLite (blocking) in one transaction"""
+        if self._conn is None or not items:
+            return
+
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations (key, value, created_at) VALUES (?, ?, ?)",
+                    [(key, value, created_at) for key, value in items]
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache write error: {e}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached translation for a key, or None if missing or expired"""
+        entry = self._get_memory(key)
+        if entry is None:
+            entry = self._get_persistent(key)
+        return self._fresh(entry)
+
+    def put(self, key: str, value: str) -> None:
+        """Store a translation under a key"""
+        self.put_many([(key, value)])
+
+    def put_many(self, items: List[Tuple[str, str]]) -> None:
+        """Store several (key, value) translations"""
+        created_at = time.time()
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value, created_at)
+        self._write_persistent(items, created_at)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """get for async callers: memory hits inline, SQLite in a worker thread"""
+        entry = self._get_memory(key)
+        if entry is None and self._conn is not None:
+            entry = await asyncio.to_thread(self._get_persistent, key)
+        return self._fresh(entry)
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, str]:
+        """Look up several keys, reading all memory misses from SQLite in one worker thread"""
+        entries = {}
+        misses = []
+        for key in keys:
+            entry = self._get_memory(key)
+            if entry is None:
+                misses.append(key)
+            else:
+                entries[key] = entry
+        if misses and self._conn is not None:
+            entries.update(await asyncio.to_thread(self._get_persistent_many, misses))
+        found = {}
+        for key, entry in entries.items():
+            value = self._fresh(entry)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def aput(self, key: str, value: str) -> None:
+        """put for async callers: the memory LRU is updated inline, SQLite in a worker thread"""
+        await self.aput_many([(key, value)])
+
+    async def aput_many(self, items: List[Tuple[str, str]]) -> None:
+        """put_many for async callers"""
+        created_at = time.time()
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value, created_at)
+        if self._conn is not None and items:
+            await asyncio.to_thread(self._write_persistent, items, created_at)
+
+    def evict_expired(self) -> int:
+        """Delete entries older than the TTL, returning the number removed"""
+        if self._conn is None or not self.ttl_seconds:
+            return 0
+
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                )
+                self._conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache eviction error: {e}")
+            return 0
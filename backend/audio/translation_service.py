@@ -1,24 +1,192 @@
+import asyncio
+import functools
+import json
 import logging
 import os
+import re
+import httpx
 import openai
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from .language_manager import LanguageManager
+from .translation_cache import TranslationCache
+from .rate_limiter import RateLimiter, estimate_tokens
+
+try:
+    import h2  # enables HTTP/2 in httpx
+except ImportError:
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# Appended to the system prompt for multi-text requests answered in JSON mode
+_BATCH_INSTRUCTIONS = (
+    ' The input is a JSON array of strings. Reply with a JSON object {"translations": [...]}'
+    ' holding one translation per input string, in the same order.'
+)
+
+# Google voice IDs have at least four dash-separated parts (xx-XX-Model-Letter);
+# captures the first letter of the last part
+_VOICE_RE = re.compile(r"^(?:[^-]*-){3,}([A-Za-z]?)[^-]*$")
+
+# Bump when the prompt templates change so cached translations are not reused
+_PROMPT_VERSION = 2
+
+# Phrases under this many words into these languages use the short-text model.
+# English is left out: English-bound text is a patient answer whose source can
+# be any supported language, while the others are always translated from English
+_SHORT_TEXT_MAX_WORDS = 10
+_SHORT_MODEL_LANGUAGES = frozenset({"spanish", "french", "german"})
+
+# Completion budget per source token; Indic and CJK translations can take
+# several times more tokens than the English source
+_MAX_TOKENS_PER_SOURCE_TOKEN = 4
+_MIN_MAX_TOKENS = 64
+
+# Speaker genders that system prompts are precomputed for
+_PROMPT_GENDERS = ("male", "female", "neutral")
+
+# Shared gender instructions for Indian languages with grammatical gender
+_GENDER_SYSTEM_INSTRUCTIONS = (
+    " Speaker: male; use masculine verb forms and adjectives.",
+    " Speaker: female; use feminine verb forms and adjectives."
+)
+
+# Gender-aware instructions for languages with grammatical gender: (male, female)
+_GENDER_INSTRUCTIONS = {
+    "hindi": (
+        " Speaker: male; use masculine forms (e.g. 'karunga', 'tha').",
+        " Speaker: female; use feminine forms (e.g. 'karungi', 'thi')."
+    ),
+    "spanish": (
+        " Speaker: male; use masculine forms (e.g. 'listo', 'contento').",
+        " Speaker: female; use feminine forms (e.g. 'lista', 'contenta')."
+    ),
+    "french": (
+        " Speaker: male; use masculine forms (e.g. 'content', 'prêt').",
+        " Speaker: female; use feminine forms (e.g. 'contente', 'prête')."
+    ),
+    "italian": (
+        " Speaker: male; use masculine forms (e.g. 'contento', 'pronto').",
+        " Speaker: female; use feminine forms (e.g. 'contenta', 'pronta')."
+    ),
+    "portuguese": (
+        " Speaker: male; use masculine forms (e.g. 'brasileiro', 'pronto').",
+        " Speaker: female; use feminine forms (e.g. 'brasileira', 'pronta')."
+    ),
+    "russian": (
+        " Speaker: male; use masculine past-tense and predicative forms.",
+        " Speaker: female; use feminine past-tense and predicative forms."
+    ),
+    "german": (
+        " Speaker: male; use masculine forms for the speaker's profession or status.",
+        " Speaker: female; use feminine forms for the speaker's profession or status."
+    ),
+    **{
+        language: _GENDER_SYSTEM_INSTRUCTIONS
+        for language in ("urdu", "bengali", "gujarati", "marathi", "tamil", "telugu", "kannada")
+    },
+}
+
+# Language-specific translation instructions, only where the target name alone
+# is not enough (script choice, source detection)
+_LANGUAGE_INSTRUCTIONS = {
+    # When translating TO English, detect source language automatically
+    "english": " Source language may vary; output natural English.",
+    "urdu": " Use Urdu (Nastaliq) script.",
+    "tamil": " Use Tamil script.",
+    "kannada": " Use Kannada script.",
+    "telugu": " Use Telugu script.",
+    "bengali": " Use Bengali script.",
+    "marathi": " Use Devanagari script.",
+    "gujarati": " Use Gujarati script.",
+    "mandarin": " Use Simplified Chinese characters.",
+    "japanese": " Use natural Kanji/Kana mix.",
+    "vietnamese": " Keep all diacritics.",
+}
+
+def _compose_system_prompt(target_display_name: str, target_language: str, gender: str) -> str:
+    """Compose the translation system prompt; arguments must be lower-cased"""
+    special_instructions = _LANGUAGE_INSTRUCTIONS.get(target_language, "")
+    
+    gender_instructions = ""
+    pair = _GENDER_INSTRUCTIONS.get(target_language)
+    if pair is not None and gender in ("male", "female"):
+        gender_instructions = pair[0] if gender == "male" else pair[1]
+    
+    return f"Translate to {target_display_name}. Output only the translation.{special_instructions}{gender_instructions}"
+
+@functools.lru_cache(maxsize=None)
+def shared_async_openai(api_key: str) -> openai.AsyncOpenAI:
+    """
+    Process-wide AsyncOpenAI client on a keep-alive (HTTP/2 when h2 is installed)
+    connection pool, so every TranslationService reuses warm TLS connections.
+    """
+    http_client = httpx.AsyncClient(
+        http2=h2 is not None,
+        # Short phases so a stalled upstream call is cut and retried instead of hanging the turn
+        timeout=httpx.Timeout(connect=5.0, read=15.0, write=5.0, pool=5.0),
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=200)
+    )
+    # The SDK retries 429s, 5xx and connection errors with exponential backoff and jitter
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=http_client,
+        max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    )
+
 class TranslationService:
     """Service for text translation using OpenAI with gender awareness"""
     
     def __init__(self, language_manager: LanguageManager):
         self.language_manager = language_manager
         
+        # Supported language code -> display name, built once for the hot path
+        self._display_names = {
+            entry["code"]: entry["name"] for entry in language_manager.get_supported_languages_list()
+        }
+        
+        # Every (language, gender) system prompt, composed once up front
+        self._system_prompts = {
+            (code, gender): _compose_system_prompt(name, code, gender)
+            for code, name in self._display_names.items()
+            for gender in _PROMPT_GENDERS
+        }
+        
         # Initialize OpenAI API key for translation
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         if self.openai_api_key:
             openai.api_key = self.openai_api_key
             logger.info("OpenAI API key configured for translation")
+            # Async client so coroutine callers don't block the event loop
+            self.aclient = shared_async_openai(self.openai_api_key)
         else:
             logger.warning("OPENAI_API_KEY not found in environment variables")
+            self.aclient = None
+        
+        # Persistent cache so repeated interview prompts skip the OpenAI round-trip
+        self.translation_model = os.getenv("TRANSLATION_MODEL_LONG", "gpt-4o-mini")
+        
+        # Short English phrases into high-resource languages can go to a smaller,
+        # faster model; defaults to the long model until one is configured
+        self.short_translation_model = os.getenv("TRANSLATION_MODEL_SHORT", self.translation_model)
+        self.cache = TranslationCache()
+        self.cache.evict_expired()
+        
+        # Proactive RPM/TPM throttle (OPENAI_MAX_REQUESTS_PER_MINUTE / OPENAI_MAX_TOKENS_PER_MINUTE)
+        self.rate_limiter = RateLimiter()
+        
+        # Caps in-flight async completions so slow upstream calls can't pile up
+        self._openai_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "20")))
+        
+        # Pending async translations by cache key, for coalescing duplicates
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def aclose(self) -> None:
+        """Close the shared AsyncOpenAI client and its connection pool"""
+        if self.aclient is not None:
+            await self.aclient.close()
+            shared_async_openai.cache_clear()
+            self.aclient = None
     
     def translate_text(self, text: str, target_language: str, gender: str = "neutral") -> str:
         """
@@ -32,40 +200,42 @@ class TranslationService:
         Returns:
             str: Translated text or original text if translation fails
         """
+        # Normalize once; the helpers below expect lower-cased arguments
+        target_language = target_language.lower()
+        gender = gender.lower()
+        
         if not self.openai_api_key:
             logger.error("OpenAI API key not configured")
             return text
         
         # Validate target language
-        if not self.language_manager.is_language_supported(target_language):
+        if target_language not in self._display_names:
             logger.warning(f"Unsupported target language: {target_language}")
             return text
             
-        target_lang = self.language_manager.get_language_display_name(target_language)
+        model = self._select_model(text, target_language)
+        cache_key = self._cache_key(text, target_language, gender, model)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # Build gender-aware instructions for specific languages
-            gender_instructions = self._build_gender_instructions(target_language, gender)
-            
-            # Build language-specific instructions
-            special_instructions = self._build_language_instructions(target_language)
-            
+            messages = self._build_messages(text, target_language, gender)
+            self.rate_limiter.acquire_sync(self._estimate_request_tokens(messages))
             response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": f"You are a translator. Translate the given text to {target_lang}. Return ONLY the translated text, nothing else.{special_instructions}{gender_instructions}"
-                    },
-                    {
-                        "role": "user", 
-                        "content": text
-                    }
-                ],
-                temperature=0
+                model=model,
+                messages=messages,
+                temperature=0,
+                max_tokens=self._max_tokens(text)
             )
             
-            translated_text = response.choices[0].message.content.strip()
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                # Never return or cache a translation cut off by max_tokens
+                logger.warning(f"Translation to {target_language} truncated, keeping original text")
+                return text
+            translated_text = choice.message.content.strip()
+            self.cache.put(cache_key, translated_text)
             logger.info(f"Translated text to {target_language} (gender: {gender})")
             return translated_text
             
@@ -73,144 +243,231 @@ class TranslationService:
             logger.error(f"Translation error: {e}")
             return text
     
-    def _build_gender_instructions(self, target_language: str, gender: str) -> str:
-        """Build gender-aware instructions for specific languages"""
-        if gender.lower() not in ["male", "female"]:
-            return ""
-        
-        gender_instructions = ""
-        
-        if target_language.lower() == "hindi":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine verb forms (e.g., 'karunga', 'hoon', 'tha') and masculine adjectives."
-            else:
-                gender_instructions = " The speaker is female, so use feminine verb forms (e.g., 'karungi', 'hoon', 'thi') and feminine adjectives."
-        elif target_language.lower() == "spanish":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine adjectives and past participles (e.g., 'estoy listo', 'soy contento')."
-            else:
-                gender_instructions = " The speaker is female, so use feminine adjectives and past participles (e.g., 'estoy lista', 'soy contenta')."
-        elif target_language.lower() == "french":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine adjectives and past participles (e.g., 'je suis content', 'je suis prêt')."
-            else:
-                gender_instructions = " The speaker is female, so use feminine adjectives and past participles (e.g., 'je suis contente', 'je suis prête')."
-        elif target_language.lower() == "italian":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine adjectives and past participles (e.g., 'sono contento', 'sono pronto')."
-            else:
-                gender_instructions = " The speaker is female, so use feminine adjectives and past participles (e.g., 'sono contenta', 'sono pronta')."
-        elif target_language.lower() == "portuguese":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine adjectives and past participles (e.g., 'estou contente', 'sou brasileiro')."
-            else:
-                gender_instructions = " The speaker is female, so use feminine adjectives and past participles (e.g., 'estou contente', 'sou brasileira')."
-        elif target_language.lower() == "russian":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine verb forms and adjectives in past tense and predicative constructions."
-            else:
-                gender_instructions = " The speaker is female, so use feminine verb forms and adjectives in past tense and predicative constructions."
-        elif target_language.lower() == "german":
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use masculine forms when referring to the speaker's profession or status."
-            else:
-                gender_instructions = " The speaker is female, so use feminine forms when referring to the speaker's profession or status."
-        elif target_language.lower() in ["urdu", "bengali", "gujarati", "marathi", "tamil", "telugu", "kannada"]:
-            if gender.lower() == "male":
-                gender_instructions = " The speaker is male, so use appropriate masculine verb forms and adjectives according to the language's gender system."
-            else:
-                gender_instructions = " The speaker is female, so use appropriate feminine verb forms and adjectives according to the language's gender system."
-        
-        return gender_instructions
-    
-    def _build_language_instructions(self, target_language: str) -> str:
-        """Build language-specific translation instructions"""
-        special_instructions = ""
-        
-        if target_language.lower() == "english":
-            # When translating TO English, detect source language automatically
-            special_instructions = " Detect the source language automatically and translate to clear, natural English."
-        elif target_language.lower() == "urdu":
-            special_instructions = " For Urdu, use proper Urdu script and vocabulary."
-        elif target_language.lower() == "tamil":
-            special_instructions = " For Tamil, use proper Tamil script and authentic vocabulary."
-        elif target_language.lower() == "kannada":
-            special_instructions = " For Kannada, use proper Kannada script and vocabulary."
-        elif target_language.lower() == "telugu":
-            special_instructions = " For Telugu, use proper Telugu script and vocabulary."
-        elif target_language.lower() == "bengali":
-            special_instructions = " For Bengali, use proper Bengali script and vocabulary."
-        elif target_language.lower() == "marathi":
-            special_instructions = " For Marathi, use proper Marathi script and vocabulary."
-        elif target_language.lower() == "gujarati":
-            special_instructions = " For Gujarati, use proper Gujarati script and vocabulary."
-        elif target_language.lower() == "mandarin":
-            special_instructions = " For Mandarin Chinese, use proper Simplified Chinese characters and vocabulary."
-        elif target_language.lower() == "spanish":
-            special_instructions = " For Spanish, use proper Spanish vocabulary and grammar."
-        elif target_language.lower() == "french":
-            special_instructions = " For French, use proper French vocabulary, grammar, and accents."
-        elif target_language.lower() == "arabic":
-            special_instructions = " For Arabic, use proper Arabic script (RTL) and vocabulary."
-        elif target_language.lower() == "portuguese":
-            special_instructions = " For Portuguese, use proper Portuguese vocabulary and grammar."
-        elif target_language.lower() == "russian":
-            special_instructions = " For Russian, use proper Cyrillic script and vocabulary."
-        elif target_language.lower() == "japanese":
-            special_instructions = " For Japanese, use proper mix of Hiragana, Katakana, and Kanji as appropriate."
-        elif target_language.lower() == "german":
-            special_instructions = " For German, use proper German vocabulary and grammar."
-        elif target_language.lower() == "korean":
-            special_instructions = " For Korean, use proper Hangul script and vocabulary."
-        elif target_language.lower() == "italian":
-            special_instructions = " For Italian, use proper Italian vocabulary and grammar."
-        elif target_language.lower() == "turkish":
-            special_instructions = " For Turkish, use proper Turkish vocabulary and grammar."
-        elif target_language.lower() == "vietnamese":
-            special_instructions = " For Vietnamese, use proper Vietnamese diacritics and vocabulary."
-        elif target_language.lower() == "thai":
-            special_instructions = " For Thai, use proper Thai script and vocabulary."
-        elif target_language.lower() == "indonesian":
-            special_instructions = " For Indonesian, use proper Indonesian vocabulary and grammar."
-        elif target_language.lower() == "dutch":
-            special_instructions = " For Dutch, use proper Dutch vocabulary and grammar."
-        
-        return special_instructions
-    
-    def detect_gender_from_voice_id(self, voice_id: str) -> str:
+    async def atranslate_text(self, text: str, target_language: str, gender: str = "neutral") -> str:
         """
-        Detect gender from Google TTS voice ID for gender-aware translation
+        Async version of translate_text using the AsyncOpenAI client
         
         Args:
-            voice_id: Google TTS voice ID (e.g., 'en-US-Neural2-F')
+            text: Text to translate
+            target_language: Target language code (e.g., 'english', 'hindi')
+            gender: Speaker gender for gender-aware languages ('male', 'female', 'neutral')
             
         Returns:
-            str: 'male', 'female', or 'neutral'
+            str: Translated text or original text if translation fails
         """
+        # Normalize once; the helpers below expect lower-cased arguments
+        target_language = target_language.lower()
+        gender = gender.lower()
+        
+        if not self.openai_api_key:
+            logger.error("OpenAI API key not configured")
+            return text
+        
+        # Validate target language
+        if target_language not in self._display_names:
+            logger.warning(f"Unsupported target language: {target_language}")
+            return text
+            
+        model = self._select_model(text, target_language)
+        cache_key = self._cache_key(text, target_language, gender, model)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Identical requests already in flight share one OpenAI call
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._atranslate_uncached(text, target_language, gender, model, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # Shielded so one cancelled caller doesn't cancel the others' shared call
+        return await asyncio.shield(task)
+    
+    async def _atranslate_uncached(self, text: str, target_language: str, gender: str, model: str, cache_key: str) -> str:
+        """Translate a cache miss through OpenAI and store the result; arguments must be lower-cased"""
         try:
-            # Google TTS voice naming pattern: xx-XX-Model-Letter
-            # Generally: A = Female, B/C/D/E/F/G/H/I/J... = Male
-            if not voice_id:
-                return "neutral"
+            messages = self._build_messages(text, target_language, gender)
+            await self.rate_limiter.acquire(self._estimate_request_tokens(messages))
+            async with self._openai_semaphore:
+                response = await self.aclient.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=0,
+                    max_tokens=self._max_tokens(text)
+                )
             
-            # Extract the last character/identifier from voice ID
-            parts = voice_id.split('-')
-            if len(parts) >= 4:
-                last_part = parts[-1]  # e.g., "A", "B", "F", etc.
-                # Handle complex suffixes like "Algenib", "HD", etc.
-                if len(last_part) > 1:
-                    # Extract first letter for complex names
-                    letter = last_part[0].upper()
-                else:
-                    letter = last_part.upper()
-                
-                # A = Female, everything else = Male (B, C, D, F, etc.)
-                return "female" if letter == 'A' else "male"
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                # Never return or cache a translation cut off by max_tokens
+                logger.warning(f"Translation to {target_language} truncated, keeping original text")
+                return text
+            translated_text = choice.message.content.strip()
+            await self.cache.aput(cache_key, translated_text)
+            logger.info(f"Translated text to {target_language} (gender: {gender})")
+            return translated_text
             
-            return "neutral"
         except Exception as e:
-            logger.warning(f"Could not detect gender from voice {voice_id}: {e}")
+            logger.error(f"Translation error: {e}")
+            return text
+    
+    async def atranslate_texts(self, texts: List[str], target_language: str, gender: str = "neutral") -> List[str]:
+        """
+        Translate several texts with a single chat completion
+        
+        Cached texts are served from the cache; the rest are sent as one JSON
+        array so the system prompt and network round-trip are paid once.
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (e.g., 'english', 'hindi')
+            gender: Speaker gender for gender-aware languages ('male', 'female', 'neutral')
+            
+        Returns:
+            list: Translations in input order, falling back to the original text per item
+        """
+        # Normalize once; the helpers below expect lower-cased arguments
+        target_language = target_language.lower()
+        gender = gender.lower()
+        
+        if not self.openai_api_key or target_language not in self._display_names:
+            return [await self.atranslate_text(text, target_language, gender) for text in texts]
+        
+        results, pending = await self._alookup_cached_texts(texts, target_language, gender)
+        if len(pending) > 1:
+            try:
+                messages = self._build_batch_messages([texts[index] for index, _ in pending], target_language, gender)
+                await self.rate_limiter.acquire(self._estimate_request_tokens(messages))
+                async with self._openai_semaphore:
+                    response = await self.aclient.chat.completions.create(
+                        model=self.translation_model,
+                        messages=messages,
+                        temperature=0,
+                        max_tokens=self._max_tokens(messages[-1]["content"]),
+                        response_format={"type": "json_object"}
+                    )
+                await self.cache.aput_many(self._apply_batch_response(response, pending, results))
+                logger.info(f"Batch translated {len(pending)} texts to {target_language} (gender: {gender})")
+            except Exception as e:
+                logger.error(f"Batch translation error: {e}")
+        
+        # Anything not covered by the batch (errors, count mismatch) goes out concurrently
+        missing = [index for index, _ in pending if results[index] is None]
+        translations = await asyncio.gather(*(self.atranslate_text(texts[index], target_language, gender) for index in missing))
+        for index, translated_text in zip(missing, translations):
+            results[index] = translated_text
+        
+        return results
+    
+    async def _alookup_cached_texts(self, texts: List[str], target_language: str, gender: str) -> Tuple[List[Optional[str]], List[Tuple[int, str]]]:
+        """Split texts into cached results and (index, cache_key) pairs still to translate"""
+        # Keyed like single-text calls so both paths share cache entries
+        keys = [self._cache_key(text, target_language, gender, self._select_model(text, target_language)) for text in texts]
+        found = await self.cache.aget_many(keys)
+        results: List[Optional[str]] = [found.get(key) for key in keys]
+        pending = [(index, key) for index, key in enumerate(keys) if results[index] is None]
+        return results, pending
+    
+    def _build_batch_messages(self, texts: List[str], target_language: str, gender: str) -> List[dict]:
+        """Build the chat messages for translating several texts as one JSON array"""
+        return [
+            {
+                "role": "system",
+                "content": self._build_system_prompt(target_language, gender) + _BATCH_INSTRUCTIONS
+            },
+            {
+                "role": "user",
+                "content": json.dumps(texts, ensure_ascii=False)
+            }
+        ]
+    
+    def _apply_batch_response(self, response, pending: List[Tuple[int, str]], results: List[Optional[str]]) -> List[Tuple[str, str]]:
+        """Fill results from a JSON batch completion, returning the (cache_key, translation) pairs to cache"""
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise ValueError("batch translation truncated by max_tokens")
+        
+        translations = json.loads(choice.message.content).get("translations")
+        if not isinstance(translations, list) or len(translations) != len(pending):
+            # Without a one-to-one match the order can't be trusted
+            raise ValueError(f"expected {len(pending)} translations, got {len(translations) if isinstance(translations, list) else 'none'}")
+        
+        entries = []
+        for (index, cache_key), translated_text in zip(pending, translations):
+            if isinstance(translated_text, str) and translated_text.strip():
+                results[index] = translated_text.strip()
+                entries.append((cache_key, results[index]))
+        return entries
+    
+    def _select_model(self, text: str, target_language: str) -> str:
+        """Route short English phrases into high-resource languages to the short-text model"""
+        if target_language in _SHORT_MODEL_LANGUAGES and len(text.split()) < _SHORT_TEXT_MAX_WORDS:
+            return self.short_translation_model
+        return self.translation_model
+    
+    def _cache_key(self, text: str, target_language: str, gender: str, model: str) -> str:
+        """Cache key for a translation under a model and the current prompt version"""
+        return TranslationCache.make_key(
+            text, target_language, gender, f"{model}@v{_PROMPT_VERSION}"
+        )
+    
+    def _build_system_prompt(self, target_language: str, gender: str) -> str:
+        """Look up the translation system prompt for a language and speaker gender"""
+        prompt = self._system_prompts.get((target_language, gender))
+        if prompt is None:
+            # Unknown genders get no gender instruction, same as neutral
+            prompt = self._system_prompts.get((target_language, "neutral"))
+        if prompt is None:
+            target_lang = self._display_names.get(target_language, target_language)
+            prompt = _compose_system_prompt(target_lang, target_language, gender)
+        return prompt
+    
+    def _max_tokens(self, text: str) -> int:
+        """Completion token cap for translating text, scaled from its length"""
+        return max(_MIN_MAX_TOKENS, estimate_tokens(text, self.translation_model) * _MAX_TOKENS_PER_SOURCE_TOKEN)
+    
+    def _build_messages(self, text: str, target_language: str, gender: str) -> List[dict]:
+        """Build the chat messages for translating a single text"""
+        return [
+            {
+                "role": "system", 
+                "content": self._build_system_prompt(target_language, gender)
+            },
+            {
+                "role": "user", 
+                "content": text
+            }
+        ]
+    
+    def _estimate_request_tokens(self, messages: List[dict]) -> int:
+        """Estimate prompt plus completion tokens for rate limiting"""
+        prompt_tokens = sum(estimate_tokens(m["content"], self.translation_model) for m in messages)
+        # A translation is roughly as long as its source text
+        completion_tokens = estimate_tokens(messages[-1]["content"], self.translation_model)
+        return prompt_tokens + completion_tokens
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def detect_gender_from_voice_id(voice_id: str) -> str:
+        """
+        Detect gender from Google TTS voice ID for gender-aware translation
+        
+        Results are memoized since only a small fixed set of voice IDs is used.
+        
+        Args:
+            voice_id: Google TTS voice ID (e.g., 'en-US-Neural2-F')
+            
+        Returns:
+            str: 'male', 'female', or 'neutral'
+        """
+        # Google TTS voice naming pattern: xx-XX-Model-Letter
+        # Generally: A = Female, B/C/D/E/F/G/H/I/J... = Male
+        # First letter of the suffix, also for complex names like "Algenib", "HD"
+        match = _VOICE_RE.match(voice_id or "")
+        if not match:
             return "neutral"
+        
+        # A = Female, everything else = Male (B, C, D, F, etc.)
+        return "female" if match.group(1) in ("A", "a") else "male"
     
     def get_supported_languages(self) -> list:
         """Get list of supported languages for translation"""
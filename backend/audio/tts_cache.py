@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk location, overridable with TTS_CACHE_DIR
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "clinical-trial-agent" / "tts"
+
+class AudioCache:
+    """
+    Cache of synthesized TTS audio keyed by (voice, speed, text).
+
+    Interview prompts repeat across sessions, so replays can skip Google TTS
+    entirely. A byte-bounded in-memory LRU sits in front of one file per
+    entry on disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or os.getenv("TTS_CACHE_DIR", _DEFAULT_CACHE_DIR))
+        self.max_memory_bytes = max_memory_bytes if max_memory_bytes is not None else int(os.getenv("TTS_CACHE_MEMORY_MB", "64")) * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.disk_enabled = True
+            logger.info(f"TTS audio cache ready at {self.cache_dir}")
+        except OSError as e:
+            logger.warning(f"TTS disk cache disabled: {e}")
+            self.disk_enabled = False
+
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float, profile: str = "") -> str:
+        """Build the cache key for a synthesis request"""
+        return hashlib.sha256(f"{voice}|{speed}|{profile}|{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, extension: str) -> Path:
+        return self.cache_dir / f"{key}.{extension}"
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        """Insert into the memory LRU, evicting the oldest entries over the byte budget"""
+        if len(audio) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            return audio
+
+    def _read_disk(self, key: str, extension: str) -> Optional[bytes]:
+        """Read an entry from disk (blocking), promoting a hit into the memory LRU"""
+        try:
+            audio = self._path(key, extension).read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"TTS cache read error: {e}")
+            return None
+
+        self._remember(key, audio)
+        return audio
+
+    def _write_disk(self, key: str, audio: bytes, extension: str) -> None:
+        """Write an entry to disk (blocking)"""
+        path = self._path(key, extension)
+        # Per-thread temp name: two sessions may synthesize the same prompt at once
+        tmp_path = path.with_suffix(f"{path.suffix}.{threading.get_ident()}.tmp")
+        try:
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"TTS cache write error: {e}")
+
+    def get(self, key: str, extension: str = "mp3") -> Optional[bytes]:
+        """Return cached audio bytes for a key, or None on a miss"""
+        audio = self._get_memory(key)
+        if audio is None and self.disk_enabled:
+            audio = self._read_disk(key, extension)
+        return audio
+
+    def put(self, key: str, audio: bytes, extension: str = "mp3") -> None:
+        """Store audio bytes under a key in memory and on disk"""
+        if not audio:
+            return
+
+        self._remember(key, audio)
+        if self.disk_enabled:
+            self._write_disk(key, audio, extension)
+
+    async def aget(self, key: str, extension: str = "mp3") -> Optional[bytes]:
+        """get for async callers: memory hits inline, disk reads in a worker thread"""
+        audio = self._get_memory(key)
+        if audio is None and self.disk_enabled:
+            audio = await asyncio.to_thread(self._read_disk, key, extension)
+        return audio
+
+    async def aput(self, key: str, audio: bytes, extension: str = "mp3") -> None:
+        """put for async callers: the memory LRU is updated inline, the file written in a worker thread"""
+        if not audio:
+            return
+
+        self._remember(key, audio)
+        if self.disk_enabled:
+            await asyncio.to_thread(self._write_disk, key, audio, extension)
@@ -1,8 +1,11 @@
 import asyncio
-import base64
+import functools
 import logging
 import os
+import threading
 from typing import Optional, Dict, Any, TYPE_CHECKING
+from .audio_utils import AudioUtils
+from .tts_cache import AudioCache
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
@@ -11,6 +14,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+try:
+    from google.cloud import texttospeech
+except ImportError:
+    logger.error("google-cloud-texttospeech is not installed; Google TTS is unavailable")
+    texttospeech = None
+
+# TTS_AUDIO_FORMAT values -> (AudioEncoding name, cache file extension).
+# OGG/Opus is roughly a third smaller than MP3 for speech.
+_AUDIO_FORMATS = {
+    "ogg_opus": ("OGG_OPUS", "ogg"),
+    "mp3": ("MP3", "mp3"),
+}
+
+@functools.lru_cache(maxsize=256)
+def _voice_to_lang(voice_id: str) -> str:
+    """Language code of a Google voice name, e.g. 'hi-IN-Neural2-A' -> 'hi-IN'"""
+    return '-'.join(voice_id.split('-')[:2])
+
 class TTSService:
     """
     Text-to-Speech service using Google Cloud TTS.
@@ -50,103 +71,185 @@ class TTSService:
         if self.language_manager:
             self.output_language = self.language_manager.validate_and_normalize_language(self.output_language)
         
+        # Output audio format, with MP3 as a fallback for clients without Opus support
+        audio_format = os.getenv("TTS_AUDIO_FORMAT", "ogg_opus").lower()
+        if audio_format not in _AUDIO_FORMATS:
+            logger.warning(f"Unsupported TTS_AUDIO_FORMAT {audio_format}, using ogg_opus")
+            audio_format = "ogg_opus"
+        self.audio_format = audio_format
+        self._audio_encoding_name, self._audio_extension = _AUDIO_FORMATS[audio_format]
+        
+        # Google TTS client is created on first use and shared by all calls
+        self._tts_client = None
+        self._client_lock = threading.Lock()
+        
+        # VoiceSelectionParams/AudioConfig protos keyed by (voice, speed, preview)
+        self._synthesis_params = {}
+        
+        # Caps concurrent synthesize calls (and their worker threads) across sessions
+        self._synthesize_semaphore = asyncio.Semaphore(int(os.getenv("GOOGLE_CONCURRENCY", "10")))
+        
+        # Synthesized audio for replayed prompts (memory LRU + disk)
+        self.audio_cache = AudioCache()
+        
         logger.info(f"TTS Service initialized - Model: {self.selected_model}, Voice: {self.selected_voice}")
+    
+    def get_client(self):
+        """Get the shared Google TTS client, creating it on first use"""
+        if self._tts_client is None:
+            # Startup warm-up and the first request may race to build it
+            with self._client_lock:
+                if self._tts_client is None:
+                    if texttospeech is None:
+                        raise Exception("google-cloud-texttospeech package not installed")
+                    self._tts_client = texttospeech.TextToSpeechClient()
+        return self._tts_client
+    
+    def close(self) -> None:
+        """Close the shared Google TTS client's gRPC channel"""
+        if self._tts_client is not None:
+            self._tts_client.transport.close()
+            self._tts_client = None
+    
+    async def _ensure_client(self):
+        """Get the shared Google TTS client, building it off the event loop on first use"""
+        if self._tts_client is None:
+            return await asyncio.to_thread(self.get_client)
+        return self._tts_client
+    
+    async def _synthesize_async(self, client, synthesis_input, voice, audio_config):
+        """Run the blocking synthesize_speech gRPC call in a worker thread, bounded by the semaphore"""
+        async with self._synthesize_semaphore:
+            return await asyncio.to_thread(
+                client.synthesize_speech,
+                input=synthesis_input,
+                voice=voice,
+                audio_config=audio_config
+            )
+    
+    async def _translate_for_output(self, text: str, gender_aware_translator=None) -> str:
+        """Translate text into the output language, with gender awareness if a translator is given"""
+        if self.output_language == "english":
+            return text
+        
+        if gender_aware_translator:
+            # Detect gender from selected voice using TranslationService
+            gender = self.translation_service.detect_gender_from_voice_id(self.selected_voice)
+            translated_text = await gender_aware_translator(text, self.output_language, gender)
+            logger.info(f"🎭 Interview TTS: Using gender-aware translation ({gender}) for {self.output_language}")
+            return translated_text
+        
+        # Use TranslationService directly
+        return await self.translation_service.atranslate_text(text, self.output_language)
+    
+    def _get_synthesis_params(self, voice_name: str, speed: float, preview: bool = False):
+        """Get cached (VoiceSelectionParams, AudioConfig) for a voice and speed"""
+        key = (voice_name, speed, preview)
+        params = self._synthesis_params.get(key)
+        if params is None:
+            voice = texttospeech.VoiceSelectionParams(
+                name=voice_name,
+                language_code=_voice_to_lang(voice_name)
+            )
+            
+            audio_encoding = texttospeech.AudioEncoding[self._audio_encoding_name]
+            if preview:
+                audio_config = texttospeech.AudioConfig(
+                    audio_encoding=audio_encoding,
+                    speaking_rate=speed
+                )
+            else:
+                audio_config = texttospeech.AudioConfig(
+                    audio_encoding=audio_encoding,
+                    speaking_rate=speed,
+                    effects_profile_id=["telephony-class-application"]
+                )
+            
+            params = (voice, audio_config)
+            self._synthesis_params[key] = params
+        return params
 
-    async def text_to_speech(self, text: str, speed: float = None, gender_aware_translator=None) -> str:
-        """Convert text to speech using Google Cloud TTS"""
+    async def text_to_speech(self, text: str, speed: float = None, gender_aware_translator=None) -> bytes:
+        """
+        Convert text to speech using Google Cloud TTS
+        
+        Returns raw audio so callers that can send binary skip the base64
+        round-trip; use text_to_speech_b64 where a JSON string is needed.
+        
+        Returns:
+            bytes: Encoded audio, or b"" on error
+        """
         if not self.google_credentials:
             logger.error("Google Cloud TTS credentials not configured")
-            return ""
+            return b""
             
         try:
             # Use provided speed or default
             speech_speed = speed if speed is not None else self.selected_speed
             logger.info(f"🎛️ TTS Speed Debug: provided_speed={speed}, saved_speed={self.selected_speed}, using_speed={speech_speed}")
             
-            # Translate if needed with gender awareness
-            if self.output_language != "english":
-                if gender_aware_translator:
-                    # Detect gender from selected voice using TranslationService
-                    gender = self.translation_service.detect_gender_from_voice_id(self.selected_voice)
-                    translated_text = gender_aware_translator(text, self.output_language, gender)
-                    logger.info(f"🎭 Interview TTS: Using gender-aware translation ({gender}) for {self.output_language}")
-                else:
-                    # Use TranslationService directly
-                    translated_text = self.translation_service.translate_text(text, self.output_language)
-            else:
-                translated_text = text
-            
-            # Import Google TTS
-            from google.cloud import texttospeech
-            
-            client = texttospeech.TextToSpeechClient()
-            synthesis_input = texttospeech.SynthesisInput(text=translated_text)
+            # Translate if needed while the TTS client (gRPC channel, credentials)
+            # warms up; the two are independent
+            translated_text, client = await asyncio.gather(
+                self._translate_for_output(text, gender_aware_translator),
+                self._ensure_client()
+            )
             
             # Get voice based on current settings
             voice_name = self.selected_voice
             
-            voice = texttospeech.VoiceSelectionParams(
-                name=voice_name,
-                language_code='-'.join(voice_name.split('-')[:2])
-            )
+            # Replayed prompts are served from the audio cache
+            cache_key = AudioCache.make_key(translated_text, voice_name, speech_speed, f"telephony-{self.audio_format}")
+            cached_audio = await self.audio_cache.aget(cache_key, self._audio_extension)
+            if cached_audio is not None:
+                logger.info(f"Serving cached Google TTS: {voice_name} at {speech_speed}x speed")
+                return cached_audio
             
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=speech_speed,
-                effects_profile_id=["telephony-class-application"]
-            )
+            synthesis_input = texttospeech.SynthesisInput(text=translated_text)
+            voice, audio_config = self._get_synthesis_params(voice_name, speech_speed)
             
-            response = client.synthesize_speech(
-                input=synthesis_input, 
-                voice=voice, 
-                audio_config=audio_config
-            )
+            response = await self._synthesize_async(client, synthesis_input, voice, audio_config)
+            await self.audio_cache.aput(cache_key, response.audio_content, self._audio_extension)
             
-            audio_base64 = base64.b64encode(response.audio_content).decode('utf-8')
             logger.info(f"Generated Google TTS: {voice_name} at {speech_speed}x speed")
-            return audio_base64
+            return response.audio_content
             
         except Exception as e:
             logger.error(f"Google TTS error: {e}")
-            return ""
+            return b""
+    
+    async def text_to_speech_b64(self, text: str, speed: float = None, gender_aware_translator=None) -> str:
+        """text_to_speech encoded as base64 for JSON transports; empty string on error"""
+        audio = await self.text_to_speech(text, speed, gender_aware_translator)
+        return await AudioUtils.abytes_to_base64(audio) if audio else ""
 
-    async def play_voice_preview(self, voice_id: str, text: str = "Hello, this is a voice preview", speed: float = None) -> str:
-        """Generate a preview audio for a specific voice"""
+    async def play_voice_preview(self, voice_id: str, text: str = "Hello, this is a voice preview", speed: float = None) -> bytes:
+        """Generate preview audio bytes for a specific voice, or b"" on error"""
         if not self.google_credentials:
-            return ""
+            return b""
             
         try:
-            from google.cloud import texttospeech
-            
             # Use provided speed or fall back to selected speed
             speaking_rate = speed if speed is not None else self.selected_speed
             
-            client = texttospeech.TextToSpeechClient()
-            synthesis_input = texttospeech.SynthesisInput(text=text)
-            
-            voice = texttospeech.VoiceSelectionParams(
-                name=voice_id,
-                language_code='-'.join(voice_id.split('-')[:2])
-            )
+            cache_key = AudioCache.make_key(text, voice_id, speaking_rate, f"preview-{self.audio_format}")
+            cached_audio = await self.audio_cache.aget(cache_key, self._audio_extension)
+            if cached_audio is not None:
+                return cached_audio
             
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=speaking_rate
-            )
+            client = await self._ensure_client()
+            synthesis_input = texttospeech.SynthesisInput(text=text)
+            voice, audio_config = self._get_synthesis_params(voice_id, speaking_rate, preview=True)
             
-            response = client.synthesize_speech(
-                input=synthesis_input, 
-                voice=voice, 
-                audio_config=audio_config
-            )
+            response = await self._synthesize_async(client, synthesis_input, voice, audio_config)
+            await self.audio_cache.aput(cache_key, response.audio_content, self._audio_extension)
             
-            audio_base64 = base64.b64encode(response.audio_content).decode('utf-8')
             logger.info(f"Generated voice preview for {voice_id} at {speaking_rate}x speed")
-            return audio_base64
+            return response.audio_content
             
         except Exception as e:
             logger.error(f"Voice preview error: {e}")
-            return ""
+            return b""
 
     def update_settings(self, settings: Dict[str, Any]) -> bool:
         """Update Google TTS settings"""
@@ -1,11 +1,228 @@
+import asyncio
+import itertools
 import logging
-from typing import Dict, List, Optional
+import re
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from .tts_service import TTSService
 from .language_manager import LanguageManager
 from .translation_service import TranslationService
+from .audio_utils import AudioUtils
 
 logger = logging.getLogger(__name__)
 
+try:
+    from google.cloud import texttospeech
+    _FEMALE = texttospeech.SsmlVoiceGender.FEMALE
+except ImportError:
+    texttospeech = None
+    _FEMALE = None
+
+# Seconds a Google voice listing is reused before list_voices is called again
+_VOICES_CACHE_TTL = 3600
+
+# Model segment of a Google voice name, e.g. "en-US-Neural2-A" -> "Neural2"
+_MODEL_RE = re.compile(r"-(Neural2|Wavenet|Standard)-")
+
+# Model and gender order used when listing voices
+_MODELS = ("neural2", "wavenet", "standard")
+_GENDERS = ("male", "female")
+
+# Translated preview texts kept in memory, keyed by (text, language, gender)
+_PREVIEW_TRANSLATION_CACHE_SIZE = 256
+
+# Default preview phrase of generate_voice_preview
+_DEFAULT_PREVIEW_TEXT = "Hello, this is a preview of my voice. How does this sound to you?"
+
+# Phrases pre-translated at startup: the Google TTS preview endpoints' default and ours
+_WARM_PREVIEW_TEXTS = ("Hello, I will guide you.", _DEFAULT_PREVIEW_TEXT)
+
+# Google TTS voice mapping used when the voice listing API is unavailable
+_VOICE_MAPPING = {
+    "english": {
+        "neural2": {"male": "en-US-Neural2-D", "female": "en-US-Neural2-F"},
+        "wavenet": {"male": "en-US-Wavenet-D", "female": "en-US-Wavenet-F"},
+        "standard": {"male": "en-US-Standard-D", "female": "en-US-Standard-F"}
+    },
+    "hindi": {
+        "neural2": {"male": "hi-IN-Neural2-B", "female": "hi-IN-Neural2-A"},
+        "wavenet": {"male": "hi-IN-Wavenet-B", "female": "hi-IN-Wavenet-A"},
+        "standard": {"male": "hi-IN-Standard-B", "female": "hi-IN-Standard-A"}
+    },
+    "spanish": {
+        "neural2": {"male": "es-ES-Neural2-B", "female": "es-ES-Neural2-A"},
+        "wavenet": {"male": "es-ES-Wavenet-B", "female": "es-ES-Wavenet-A"},
+        "standard": {"male": "es-ES-Standard-B", "female": "es-ES-Standard-A"}
+    },
+    "french": {
+        "neural2": {"male": "fr-FR-Neural2-B", "female": "fr-FR-Neural2-A"},
+        "wavenet": {"male": "fr-FR-Wavenet-B", "female": "fr-FR-Wavenet-A"},
+        "standard": {"male": "fr-FR-Standard-B", "female": "fr-FR-Standard-A"}
+    },
+    "german": {
+        "neural2": {"male": "de-DE-Neural2-B", "female": "de-DE-Neural2-A"},
+        "wavenet": {"male": "de-DE-Wavenet-B", "female": "de-DE-Wavenet-A"},
+        "standard": {"male": "de-DE-Standard-B", "female": "de-DE-Standard-A"}
+    },
+    "italian": {
+        "neural2": {"male": "it-IT-Neural2-C", "female": "it-IT-Neural2-A"},
+        "wavenet": {"male": "it-IT-Wavenet-C", "female": "it-IT-Wavenet-A"},
+        "standard": {"male": "it-IT-Standard-C", "female": "it-IT-Standard-A"}
+    },
+    "portuguese": {
+        "neural2": {"male": "pt-BR-Neural2-B", "female": "pt-BR-Neural2-A"},
+        "wavenet": {"male": "pt-BR-Wavenet-B", "female": "pt-BR-Wavenet-A"},
+        "standard": {"male": "pt-BR-Standard-B", "female": "pt-BR-Standard-A"}
+    },
+    "russian": {
+        "neural2": {"male": "ru-RU-Neural2-B", "female": "ru-RU-Neural2-A"},
+        "wavenet": {"male": "ru-RU-Wavenet-B", "female": "ru-RU-Wavenet-A"},
+        "standard": {"male": "ru-RU-Standard-B", "female": "ru-RU-Standard-A"}
+    },
+    "japanese": {
+        "neural2": {"male": "ja-JP-Neural2-C", "female": "ja-JP-Neural2-A"},
+        "wavenet": {"male": "ja-JP-Wavenet-C", "female": "ja-JP-Wavenet-A"},
+        "standard": {"male": "ja-JP-Standard-C", "female": "ja-JP-Standard-A"}
+    },
+    "korean": {
+        "neural2": {"male": "ko-KR-Neural2-C", "female": "ko-KR-Neural2-A"},
+        "wavenet": {"male": "ko-KR-Wavenet-C", "female": "ko-KR-Wavenet-A"},
+        "standard": {"male": "ko-KR-Standard-C", "female": "ko-KR-Standard-A"}
+    },
+    "mandarin": {
+        "neural2": {"male": "zh-CN-Neural2-B", "female": "zh-CN-Neural2-A"},
+        "wavenet": {"male": "zh-CN-Wavenet-B", "female": "zh-CN-Wavenet-A"},
+        "standard": {"male": "zh-CN-Standard-B", "female": "zh-CN-Standard-A"}
+    },
+    "arabic": {
+        "neural2": {"male": "ar-XA-Neural2-B", "female": "ar-XA-Neural2-A"},
+        "wavenet": {"male": "ar-XA-Wavenet-B", "female": "ar-XA-Wavenet-A"},
+        "standard": {"male": "ar-XA-Standard-B", "female": "ar-XA-Standard-A"}
+    },
+    "dutch": {
+        "neural2": {"male": "nl-NL-Neural2-B", "female": "nl-NL-Neural2-A"},
+        "wavenet": {"male": "nl-NL-Wavenet-B", "female": "nl-NL-Wavenet-A"},
+        "standard": {"male": "nl-NL-Standard-B", "female": "nl-NL-Standard-A"}
+    },
+    "turkish": {
+        "neural2": {"male": "tr-TR-Neural2-B", "female": "tr-TR-Neural2-A"},
+        "wavenet": {"male": "tr-TR-Wavenet-B", "female": "tr-TR-Wavenet-A"},
+        "standard": {"male": "tr-TR-Standard-B", "female": "tr-TR-Standard-A"}
+    },
+    "vietnamese": {
+        "neural2": {"male": "vi-VN-Neural2-B", "female": "vi-VN-Neural2-A"},
+        "wavenet": {"male": "vi-VN-Wavenet-B", "female": "vi-VN-Wavenet-A"},
+        "standard": {"male": "vi-VN-Standard-B", "female": "vi-VN-Standard-A"}
+    },
+    "thai": {
+        "neural2": {"male": "th-TH-Neural2-B", "female": "th-TH-Neural2-A"},
+        "wavenet": {"male": "th-TH-Wavenet-B", "female": "th-TH-Wavenet-A"},
+        "standard": {"male": "th-TH-Standard-B", "female": "th-TH-Standard-A"}
+    },
+    "indonesian": {
+        "neural2": {"male": "id-ID-Neural2-B", "female": "id-ID-Neural2-A"},
+        "wavenet": {"male": "id-ID-Wavenet-B", "female": "id-ID-Wavenet-A"},
+        "standard": {"male": "id-ID-Standard-B", "female": "id-ID-Standard-A"}
+    },
+    "bengali": {
+        "neural2": {"male": "bn-IN-Neural2-B", "female": "bn-IN-Neural2-A"},
+        "wavenet": {"male": "bn-IN-Wavenet-B", "female": "bn-IN-Wavenet-A"},
+        "standard": {"male": "bn-IN-Standard-B", "female": "bn-IN-Standard-A"}
+    },
+    "telugu": {
+        "neural2": {"male": "te-IN-Neural2-B", "female": "te-IN-Neural2-A"},
+        "wavenet": {"male": "te-IN-Wavenet-B", "female": "te-IN-Wavenet-A"},
+        "standard": {"male": "te-IN-Standard-B", "female": "te-IN-Standard-A"}
+    },
+    "marathi": {
+        "neural2": {"male": "mr-IN-Neural2-B", "female": "mr-IN-Neural2-A"},
+        "wavenet": {"male": "mr-IN-Wavenet-B", "female": "mr-IN-Wavenet-A"},
+        "standard": {"male": "mr-IN-Standard-B", "female": "mr-IN-Standard-A"}
+    },
+    "tamil": {
+        "neural2": {"male": "ta-IN-Neural2-B", "female": "ta-IN-Neural2-A"},
+        "wavenet": {"male": "ta-IN-Wavenet-B", "female": "ta-IN-Wavenet-A"},
+        "standard": {"male": "ta-IN-Standard-B", "female": "ta-IN-Standard-A"}
+    },
+    "gujarati": {
+        "neural2": {"male": "gu-IN-Neural2-B", "female": "gu-IN-Neural2-A"},
+        "wavenet": {"male": "gu-IN-Wavenet-B", "female": "gu-IN-Wavenet-A"},
+        "standard": {"male": "gu-IN-Standard-B", "female": "gu-IN-Standard-A"}
+    },
+    "urdu": {
+        "neural2": {"male": "ur-IN-Neural2-B", "female": "ur-IN-Neural2-A"},
+        "wavenet": {"male": "ur-IN-Wavenet-B", "female": "ur-IN-Wavenet-A"},
+        "standard": {"male": "ur-IN-Standard-B", "female": "ur-IN-Standard-A"}
+    },
+    "kannada": {
+        "neural2": {"male": "kn-IN-Neural2-B", "female": "kn-IN-Neural2-A"},
+        "wavenet": {"male": "kn-IN-Wavenet-B", "female": "kn-IN-Wavenet-A"},
+        "standard": {"male": "kn-IN-Standard-B", "female": "kn-IN-Standard-A"}
+    }
+}
+
+# Single-level view of _VOICE_MAPPING keyed by (language, model, gender)
+_FLAT_VOICE_MAPPING: Dict[Tuple[str, str, str], str] = {
+    (language, model, gender): voice_id
+    for language, models in _VOICE_MAPPING.items()
+    for model, genders in models.items()
+    for gender, voice_id in genders.items()
+}
+
+# Voice name mappings for friendly names
+_VOICE_NAMES = {
+    # English voices
+    "en-US-Neural2-D": "Marcus", "en-US-Neural2-F": "Emma",
+    "en-US-Neural2-A": "Alice", "en-US-Neural2-C": "Charlotte",
+    "en-US-Neural2-E": "Elizabeth", "en-US-Neural2-G": "Grace",
+    "en-US-Neural2-H": "Henry", "en-US-Neural2-I": "Isabella",
+    "en-US-Neural2-J": "James",
+    # Hindi voices  
+    "hi-IN-Neural2-A": "Priya", "hi-IN-Neural2-B": "Arjun",
+    "hi-IN-Neural2-C": "Chandra", "hi-IN-Neural2-D": "Deepak",
+    # Spanish voices
+    "es-ES-Neural2-A": "Sofia", "es-ES-Neural2-B": "Diego",
+    "es-ES-Neural2-C": "Carmen", "es-ES-Neural2-F": "Fernando",
+    # French voices
+    "fr-FR-Neural2-A": "Amélie", "fr-FR-Neural2-B": "Bernard",
+    "fr-FR-Neural2-C": "Céline", "fr-FR-Neural2-D": "Didier",
+    # German voices
+    "de-DE-Neural2-A": "Anna", "de-DE-Neural2-B": "Bernd", 
+    "de-DE-Neural2-C": "Claudia", "de-DE-Neural2-F": "Friedrich",
+    # Italian voices
+    "it-IT-Neural2-A": "Alessandra", "it-IT-Neural2-C": "Carlo",
+    # Arabic voices
+    "ar-XA-Neural2-A": "Layla", "ar-XA-Neural2-B": "Omar",
+    "ar-XA-Neural2-C": "Zahra", "ar-XA-Neural2-D": "Hassan",
+}
+
+@dataclass(frozen=True, slots=True)
+class VoiceEntry:
+    """A TTS voice as listed by VoiceManager"""
+    id: str
+    name: str
+    model: str
+    gender: str
+    language: str
+    language_code: Optional[str] = None
+    natural_sample_rate: Optional[int] = None
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready dict, omitting fields unknown for hardcoded fallback voices"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+def _voice_letter(voice_id: str) -> str:
+    """Extract the variant letter from a voice ID (e.g., 'A' from 'en-US-Neural2-A')"""
+    # Google voice IDs end in their single-letter variant
+    letter = voice_id[-1:]
+    return letter.upper() if letter.isalpha() else 'A'
+
+def _quality_key(voice: VoiceEntry):
+    """Sort key preferring higher sample rates; ties broken by voice ID for consistent selection"""
+    return (-(voice.natural_sample_rate or 0), voice.id)
+
 class VoiceManager:
     """Service for managing voices, previews, and voice-related operations"""
     
@@ -14,160 +231,45 @@ class VoiceManager:
         self.language_manager = language_manager
         self.translation_service = translation_service
         
-        # Google TTS voice mapping (moved from TTSService)
-        self.voice_mapping = {
-            "english": {
-                "neural2": {"male": "en-US-Neural2-D", "female": "en-US-Neural2-F"},
-                "wavenet": {"male": "en-US-Wavenet-D", "female": "en-US-Wavenet-F"},
-                "standard": {"male": "en-US-Standard-D", "female": "en-US-Standard-F"}
-            },
-            "hindi": {
-                "neural2": {"male": "hi-IN-Neural2-B", "female": "hi-IN-Neural2-A"},
-                "wavenet": {"male": "hi-IN-Wavenet-B", "female": "hi-IN-Wavenet-A"},
-                "standard": {"male": "hi-IN-Standard-B", "female": "hi-IN-Standard-A"}
-            },
-            "spanish": {
-                "neural2": {"male": "es-ES-Neural2-B", "female": "es-ES-Neural2-A"},
-                "wavenet": {"male": "es-ES-Wavenet-B", "female": "es-ES-Wavenet-A"},
-                "standard": {"male": "es-ES-Standard-B", "female": "es-ES-Standard-A"}
-            },
-            "french": {
-                "neural2": {"male": "fr-FR-Neural2-B", "female": "fr-FR-Neural2-A"},
-                "wavenet": {"male": "fr-FR-Wavenet-B", "female": "fr-FR-Wavenet-A"},
-                "standard": {"male": "fr-FR-Standard-B", "female": "fr-FR-Standard-A"}
-            },
-            "german": {
-                "neural2": {"male": "de-DE-Neural2-B", "female": "de-DE-Neural2-A"},
-                "wavenet": {"male": "de-DE-Wavenet-B", "female": "de-DE-Wavenet-A"},
-                "standard": {"male": "de-DE-Standard-B", "female": "de-DE-Standard-A"}
-            },
-            "italian": {
-                "neural2": {"male": "it-IT-Neural2-C", "female": "it-IT-Neural2-A"},
-                "wavenet": {"male": "it-IT-Wavenet-C", "female": "it-IT-Wavenet-A"},
-                "standard": {"male": "it-IT-Standard-C", "female": "it-IT-Standard-A"}
-            },
-            "portuguese": {
-                "neural2": {"male": "pt-BR-Neural2-B", "female": "pt-BR-Neural2-A"},
-                "wavenet": {"male": "pt-BR-Wavenet-B", "female": "pt-BR-Wavenet-A"},
-                "standard": {"male": "pt-BR-Standard-B", "female": "pt-BR-Standard-A"}
-            },
-            "russian": {
-                "neural2": {"male": "ru-RU-Neural2-B", "female": "ru-RU-Neural2-A"},
-                "wavenet": {"male": "ru-RU-Wavenet-B", "female": "ru-RU-Wavenet-A"},
-                "standard": {"male": "ru-RU-Standard-B", "female": "ru-RU-Standard-A"}
-            },
-            "japanese": {
-                "neural2": {"male": "ja-JP-Neural2-C", "female": "ja-JP-Neural2-A"},
-                "wavenet": {"male": "ja-JP-Wavenet-C", "female": "ja-JP-Wavenet-A"},
-                "standard": {"male": "ja-JP-Standard-C", "female": "ja-JP-Standard-A"}
-            },
-            "korean": {
-                "neural2": {"male": "ko-KR-Neural2-C", "female": "ko-KR-Neural2-A"},
-                "wavenet": {"male": "ko-KR-Wavenet-C", "female": "ko-KR-Wavenet-A"},
-                "standard": {"male": "ko-KR-Standard-C", "female": "ko-KR-Standard-A"}
-            },
-            "mandarin": {
-                "neural2": {"male": "zh-CN-Neural2-B", "female": "zh-CN-Neural2-A"},
-                "wavenet": {"male": "zh-CN-Wavenet-B", "female": "zh-CN-Wavenet-A"},
-                "standard": {"male": "zh-CN-Standard-B", "female": "zh-CN-Standard-A"}
-            },
-            "arabic": {
-                "neural2": {"male": "ar-XA-Neural2-B", "female": "ar-XA-Neural2-A"},
-                "wavenet": {"male": "ar-XA-Wavenet-B", "female": "ar-XA-Wavenet-A"},
-                "standard": {"male": "ar-XA-Standard-B", "female": "ar-XA-Standard-A"}
-            },
-            "dutch": {
-                "neural2": {"male": "nl-NL-Neural2-B", "female": "nl-NL-Neural2-A"},
-                "wavenet": {"male": "nl-NL-Wavenet-B", "female": "nl-NL-Wavenet-A"},
-                "standard": {"male": "nl-NL-Standard-B", "female": "nl-NL-Standard-A"}
-            },
-            "turkish": {
-                "neural2": {"male": "tr-TR-Neural2-B", "female": "tr-TR-Neural2-A"},
-                "wavenet": {"male": "tr-TR-Wavenet-B", "female": "tr-TR-Wavenet-A"},
-                "standard": {"male": "tr-TR-Standard-B", "female": "tr-TR-Standard-A"}
-            },
-            "vietnamese": {
-                "neural2": {"male": "vi-VN-Neural2-B", "female": "vi-VN-Neural2-A"},
-                "wavenet": {"male": "vi-VN-Wavenet-B", "female": "vi-VN-Wavenet-A"},
-                "standard": {"male": "vi-VN-Standard-B", "female": "vi-VN-Standard-A"}
-            },
-            "thai": {
-                "neural2": {"male": "th-TH-Neural2-B", "female": "th-TH-Neural2-A"},
-                "wavenet": {"male": "th-TH-Wavenet-B", "female": "th-TH-Wavenet-A"},
-                "standard": {"male": "th-TH-Standard-B", "female": "th-TH-Standard-A"}
-            },
-            "indonesian": {
-                "neural2": {"male": "id-ID-Neural2-B", "female": "id-ID-Neural2-A"},
-                "wavenet": {"male": "id-ID-Wavenet-B", "female": "id-ID-Wavenet-A"},
-                "standard": {"male": "id-ID-Standard-B", "female": "id-ID-Standard-A"}
-            },
-            "bengali": {
-                "neural2": {"male": "bn-IN-Neural2-B", "female": "bn-IN-Neural2-A"},
-                "wavenet": {"male": "bn-IN-Wavenet-B", "female": "bn-IN-Wavenet-A"},
-                "standard": {"male": "bn-IN-Standard-B", "female": "bn-IN-Standard-A"}
-            },
-            "telugu": {
-                "neural2": {"male": "te-IN-Neural2-B", "female": "te-IN-Neural2-A"},
-                "wavenet": {"male": "te-IN-Wavenet-B", "female": "te-IN-Wavenet-A"},
-                "standard": {"male": "te-IN-Standard-B", "female": "te-IN-Standard-A"}
-            },
-            "marathi": {
-                "neural2": {"male": "mr-IN-Neural2-B", "female": "mr-IN-Neural2-A"},
-                "wavenet": {"male": "mr-IN-Wavenet-B", "female": "mr-IN-Wavenet-A"},
-                "standard": {"male": "mr-IN-Standard-B", "female": "mr-IN-Standard-A"}
-            },
-            "tamil": {
-                "neural2": {"male": "ta-IN-Neural2-B", "female": "ta-IN-Neural2-A"},
-                "wavenet": {"male": "ta-IN-Wavenet-B", "female": "ta-IN-Wavenet-A"},
-                "standard": {"male": "ta-IN-Standard-B", "female": "ta-IN-Standard-A"}
-            },
-            "gujarati": {
-                "neural2": {"male": "gu-IN-Neural2-B", "female": "gu-IN-Neural2-A"},
-                "wavenet": {"male": "gu-IN-Wavenet-B", "female": "gu-IN-Wavenet-A"},
-                "standard": {"male": "gu-IN-Standard-B", "female": "gu-IN-Standard-A"}
-            },
-            "urdu": {
-                "neural2": {"male": "ur-IN-Neural2-B", "female": "ur-IN-Neural2-A"},
-                "wavenet": {"male": "ur-IN-Wavenet-B", "female": "ur-IN-Wavenet-A"},
-                "standard": {"male": "ur-IN-Standard-B", "female": "ur-IN-Standard-A"}
-            },
-            "kannada": {
-                "neural2": {"male": "kn-IN-Neural2-B", "female": "kn-IN-Neural2-A"},
-                "wavenet": {"male": "kn-IN-Wavenet-B", "female": "kn-IN-Wavenet-A"},
-                "standard": {"male": "kn-IN-Standard-B", "female": "kn-IN-Standard-A"}
-            }
+        # Voice tables are process-wide constants; instances share them
+        self.voice_mapping = _VOICE_MAPPING
+        self.voice_names = _VOICE_NAMES
+        
+        self._flat_voice_mapping = _FLAT_VOICE_MAPPING
+        
+        # Memoized get_voice_friendly_name results (voice IDs are a small, stable set)
+        self._friendly_name_cache: Dict[str, str] = {}
+        
+        # Hardcoded fallback listings never change, so build them once
+        self._fallback_voices_cache = {
+            language: self._build_fallback_voices(language) for language in self.voice_mapping
         }
         
-        # Voice name mappings for friendly names
-        self.voice_names = {
-            # English voices
-            "en-US-Neural2-D": "Marcus", "en-US-Neural2-F": "Emma",
-            "en-US-Neural2-A": "Alice", "en-US-Neural2-C": "Charlotte",
-            "en-US-Neural2-E": "Elizabeth", "en-US-Neural2-G": "Grace",
-            "en-US-Neural2-H": "Henry", "en-US-Neural2-I": "Isabella",
-            "en-US-Neural2-J": "James",
-            # Hindi voices  
-            "hi-IN-Neural2-A": "Priya", "hi-IN-Neural2-B": "Arjun",
-            "hi-IN-Neural2-C": "Chandra", "hi-IN-Neural2-D": "Deepak",
-            # Spanish voices
-            "es-ES-Neural2-A": "Sofia", "es-ES-Neural2-B": "Diego",
-            "es-ES-Neural2-C": "Carmen", "es-ES-Neural2-F": "Fernando",
-            # French voices
-            "fr-FR-Neural2-A": "Amélie", "fr-FR-Neural2-B": "Bernard",
-            "fr-FR-Neural2-C": "Céline", "fr-FR-Neural2-D": "Didier",
-            # German voices
-            "de-DE-Neural2-A": "Anna", "de-DE-Neural2-B": "Bernd", 
-            "de-DE-Neural2-C": "Claudia", "de-DE-Neural2-F": "Friedrich",
-            # Italian voices
-            "it-IT-Neural2-A": "Alessandra", "it-IT-Neural2-C": "Carlo",
-            # Arabic voices
-            "ar-XA-Neural2-A": "Layla", "ar-XA-Neural2-B": "Omar",
-            "ar-XA-Neural2-C": "Zahra", "ar-XA-Neural2-D": "Hassan",
+        # Voice listings per language: language -> (fetched_at, voices)
+        self._voices_cache: Dict[str, Tuple[float, Dict[str, List[VoiceEntry]]]] = {}
+        
+        # Reverse index voice_id -> (language, voice_data), built lazily for get_voice_info
+        self._voice_index: Optional[Dict[str, Tuple[str, VoiceEntry]]] = None
+        self._voice_index_built_at = 0.0
+        
+        # Derived views of a listing: language -> (listing, voice IDs, voices by model)
+        self._voice_views: Dict[str, Tuple[Dict, FrozenSet[str], Dict[str, List[VoiceEntry]]]] = {}
+        
+        # Google language code -> supported language, for resolving a voice ID's language
+        self._language_by_code: Dict[str, str] = {
+            code: language for language, code in self.language_manager.google_language_mapping.items()
         }
         
+        # LRU of translated preview texts; previews reuse a handful of phrases
+        self._preview_translation_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        
+        # Raw Google voices partitioned by language code, from one list_voices call
+        self._voices_by_language: Optional[Dict[str, list]] = None
+        self._voices_by_language_loaded_at = 0.0
+        
         logger.info("Voice Manager initialized")
     
-    def get_available_voices(self, language: Optional[str] = None) -> Dict[str, List[Dict]]:
+    def get_available_voices(self, language: Optional[str] = None) -> Dict[str, List[VoiceEntry]]:
         """
         Get available voices for a language using Google Cloud TTS API
         
@@ -184,82 +286,129 @@ class VoiceManager:
             logger.warning(f"Language {target_language} not supported for voice listing")
             return {"male": [], "female": []}
         
+        # Serve from the cache while the listing is fresh
+        cached = self._voices_cache.get(target_language)
+        if cached is not None and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            return cached[1]
+        
         try:
-            from google.cloud import texttospeech
-            
-            # Initialize client
-            client = texttospeech.TextToSpeechClient()
-            
-            # Get Google language code using LanguageManager
-            language_code = self.language_manager.get_google_language_code(target_language)
-            
-            # List all available voices from Google Cloud TTS
-            voices_request = texttospeech.ListVoicesRequest(language_code=language_code)
-            voices_response = client.list_voices(request=voices_request)
-            
-            # Collect all voices by model and gender
-            all_voices = {"male": {}, "female": {}}
-            
-            for voice in voices_response.voices:
-                # Skip voices that don't match our target language
-                if not voice.language_codes or language_code not in voice.language_codes:
-                    continue
-                
-                # Determine model type from voice name
-                voice_name = voice.name
-                model = "standard"  # default
-                if "Neural2" in voice_name:
-                    model = "neural2"
-                elif "Wavenet" in voice_name:
-                    model = "wavenet"
-                elif "Standard" in voice_name:
-                    model = "standard"
-                
-                # Determine gender
-                gender = "female" if voice.ssml_gender == texttospeech.SsmlVoiceGender.FEMALE else "male"
-                
-                voice_data = {
-                    "id": voice_name,
-                    "name": self.get_voice_friendly_name(voice_name),
-                    "model": model,
-                    "gender": gender,
-                    "language": target_language,
-                    "language_code": language_code,
-                    "natural_sample_rate": voice.natural_sample_rate_hertz
-                }
-                
-                # Group by model and gender
-                if model not in all_voices[gender]:
-                    all_voices[gender][model] = []
-                all_voices[gender][model].append(voice_data)
-            
-            # Apply smart filtering: max 2 voices per gender per model
-            result = {"male": [], "female": []}
-            
-            for gender in ["male", "female"]:
-                for model in ["neural2", "wavenet", "standard"]:
-                    if model in all_voices[gender]:
-                        model_voices = all_voices[gender][model]
-                        # Select most variant voices (max 2 per gender per model)
-                        selected_voices = self._select_variant_voices(model_voices, max_count=2)
-                        result[gender].extend(selected_voices)
-            
-            logger.info(f"Filtered to {len(result['male']) + len(result['female'])} voices for {target_language}")
-            logger.info(f"Voice counts by model: neural2={len([v for v in result['male'] + result['female'] if v['model'] == 'neural2'])}, "
-                       f"wavenet={len([v for v in result['male'] + result['female'] if v['model'] == 'wavenet'])}, "
-                       f"standard={len([v for v in result['male'] + result['female'] if v['model'] == 'standard'])}")
-            
+            result = self._fetch_voices(target_language)
+            self._voices_cache[target_language] = (time.monotonic(), result)
             return result
             
         except Exception as e:
             logger.error(f"Error getting voices from Google Cloud TTS: {e}")
-            # Use hardcoded mapping as backup
+            # Use hardcoded mapping as backup (not cached, so the API is retried)
             if target_language in self.voice_mapping:
                 logger.warning(f"Using fallback hardcoded voices for {target_language}")
                 return self._get_fallback_voices(target_language)
             else:
                 return {"male": [], "female": []}
     
+    def refresh_voices(self) -> None:
+        """Drop cached voice listings so the next lookup queries Google again"""
+        self._voices_cache.clear()
+        self._voice_index = None
+        self._voice_views.clear()
+        self._voices_by_language = None
+    
+    def _get_voice_views(self, target_language: str) -> Tuple[FrozenSet[str], Dict[str, List[VoiceEntry]]]:
+        """Voice ID set and model grouping for a language, rebuilt when its listing changes"""
+        voices = self.get_available_voices(target_language)
+        views = self._voice_views.get(target_language)
+        if views is None or views[0] is not voices:
+            all_voices = voices.get("male", []) + voices.get("female", [])
+            by_model: Dict[str, List[VoiceEntry]] = {}
+            for voice in all_voices:
+                by_model.setdefault(voice.model, []).append(voice)
+            views = (voices, frozenset(voice.id for voice in all_voices), by_model)
+            self._voice_views[target_language] = views
+        return views[1], views[2]
+    
+    def _build_voice_index(self) -> Dict[str, Tuple[str, VoiceEntry]]:
+        """Index every supported language's voices by voice ID"""
+        index = {}
+        for language in self.language_manager.supported_languages:
+            voices = self.get_available_voices(language)
+            for voice in voices.get("male", []) + voices.get("female", []):
+                # First language listing a voice wins, matching the old scan order
+                index.setdefault(voice.id, (language, voice))
+        
+        self._voice_index = index
+        self._voice_index_built_at = time.monotonic()
+        return index
+    
+    def _load_all_voices(self) -> Dict[str, list]:
+        """List every Google Cloud TTS voice in one request, partitioned by language code"""
+        if (self._voices_by_language is not None
+                and time.monotonic() - self._voices_by_language_loaded_at < _VOICES_CACHE_TTL):
+            return self._voices_by_language
+        
+        # Reuse the TTS service's client rather than opening a new gRPC channel
+        client = self.tts_service.get_client()
+        
+        # An empty language_code lists voices for all languages
+        voices_response = client.list_voices(request=texttospeech.ListVoicesRequest())
+        
+        voices_by_language: Dict[str, list] = {}
+        for voice in voices_response.voices:
+            for language_code in voice.language_codes:
+                voices_by_language.setdefault(language_code, []).append(voice)
+        
+        self._voices_by_language = voices_by_language
+        self._voices_by_language_loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(voices_response.voices)} Google TTS voices across {len(voices_by_language)} language codes")
+        return voices_by_language
+    
+    def _fetch_voices(self, target_language: str) -> Dict[str, List[VoiceEntry]]:
+        """List and filter the Google Cloud TTS voices for a supported language"""
+        # Get Google language code using LanguageManager
+        language_code = self.language_manager.get_google_language_code(target_language)
+        
+        # Collect all voices by model and gender
+        all_voices = {"male": defaultdict(list), "female": defaultdict(list)}
+        
+        for voice in self._load_all_voices().get(language_code, []):
+            # Determine model type from voice name
+            voice_name = voice.name
+            match = _MODEL_RE.search(voice_name)
+            model = match.group(1).lower() if match else "standard"  # default
+            
+            # Determine gender
+            gender = "female" if voice.ssml_gender == _FEMALE else "male"
+            
+            voice_data = VoiceEntry(
+                id=voice_name,
+                name=self.get_voice_friendly_name(voice_name),
+                model=model,
+                gender=gender,
+                language=target_language,
+                language_code=language_code,
+                natural_sample_rate=voice.natural_sample_rate_hertz
+            )
+            
+            # Group by model and gender
+            all_voices[gender][model].append(voice_data)
+        
+        # Apply smart filtering: max 2 voices per gender per model
+        result = {"male": [], "female": []}
+        
+        for gender in _GENDERS:
+            for model in _MODELS:
+                if model in all_voices[gender]:
+                    model_voices = all_voices[gender][model]
+                    # Select most variant voices (max 2 per gender per model)
+                    selected_voices = self._select_two_variant_voices(model_voices)
+                    result[gender].extend(selected_voices)
+        
+        if logger.isEnabledFor(logging.INFO):
+            counts = Counter(voice.model for voice in itertools.chain(result["male"], result["female"]))
+            logger.info(f"Filtered to {len(result['male']) + len(result['female'])} voices for {target_language}")
+            logger.info(f"Voice counts by model: neural2={counts['neural2']}, "
+                       f"wavenet={counts['wavenet']}, standard={counts['standard']}")
+        
+        return result
+    
     def get_available_models(self) -> List[Dict]:
         """Get available TTS models"""
         return self.tts_service.get_available_models()
@@ -279,19 +428,20 @@ class VoiceManager:
             str: Base64 encoded audio or empty string on error
         """
         target_language = language or self.tts_service.output_language
-        preview_text = text or "Hello, this is a preview of my voice. How does this sound to you?"
+        preview_text = text or _DEFAULT_PREVIEW_TEXT
         
         try:
             # Translate preview text if needed
             if target_language != "english":
                 # Detect gender from voice for gender-aware translation
                 gender = self.translation_service.detect_gender_from_voice_id(voice_id)
-                preview_text = self.translation_service.translate_text(preview_text, target_language, gender)
-                logger.info(f"Translated preview text for {target_language} with gender {gender}")
+                preview_text = await self._translate_preview_text(preview_text, target_language, gender)
             
             # Generate preview using TTS service
-            audio_base64 = await self.tts_service.play_voice_preview(voice_id, preview_text, speed)
+            audio = await self.tts_service.play_voice_preview(voice_id, preview_text, speed)
             
+            # Encode at the JSON boundary
+            audio_base64 = await AudioUtils.abytes_to_base64(audio) if audio else ""
             if audio_base64:
                 logger.info(f"Generated voice preview for {voice_id} in {target_language}")
             else:
@@ -303,6 +453,65 @@ class VoiceManager:
             logger.error(f"Error generating voice preview for {voice_id}: {e}")
             return ""
     
+    async def warm_preview_translations(self, texts: Tuple[str, ...] = _WARM_PREVIEW_TEXTS) -> int:
+        """
+        Translate preview phrases into every language for both voice genders
+        
+        Meant to run once in the background at startup, so later previews skip
+        OpenAI entirely. Results land in the preview cache and in the persistent
+        translation cache, so later restarts are served from disk.
+        
+        Args:
+            texts: Preview phrases to translate
+            
+        Returns:
+            int: Number of translations now cached
+        """
+        # One batched OpenAI call per language/gender pair instead of one per phrase
+        jobs = [
+            (language, gender)
+            for language in self.language_manager.supported_languages
+            if language != "english"
+            for gender in _GENDERS
+        ]
+        results = await asyncio.gather(
+            *(self.translation_service.atranslate_texts(list(texts), language, gender) for language, gender in jobs),
+            return_exceptions=True
+        )
+        warmed = 0
+        for (language, gender), translations in zip(jobs, results):
+            if isinstance(translations, BaseException):
+                continue
+            for text, translated in zip(texts, translations):
+                if self._remember_preview_translation((text, language, gender), translated):
+                    warmed += 1
+        logger.info(f"Warmed {warmed}/{len(jobs) * len(texts)} voice preview translations")
+        return warmed
+    
+    async def _translate_preview_text(self, text: str, target_language: str, gender: str) -> str:
+        """Translate preview text, reusing earlier translations of the same phrase"""
+        key = (text, target_language, gender)
+        cached = self._preview_translation_cache.get(key)
+        if cached is not None:
+            self._preview_translation_cache.move_to_end(key)
+            return cached
+        
+        translated = await self.translation_service.atranslate_text(text, target_language, gender)
+        logger.info(f"Translated preview text for {target_language} with gender {gender}")
+        self._remember_preview_translation(key, translated)
+        return translated
+    
+    def _remember_preview_translation(self, key: Tuple[str, str, str], translated: str) -> bool:
+        """Store a preview translation, returning False for failed (unchanged) ones"""
+        # Failed translations come back unchanged; don't pin those
+        if translated == key[0]:
+            return False
+        self._preview_translation_cache[key] = translated
+        self._preview_translation_cache.move_to_end(key)
+        if len(self._preview_translation_cache) > _PREVIEW_TRANSLATION_CACHE_SIZE:
+            self._preview_translation_cache.popitem(last=False)
+        return True
+    
     def validate_voice(self, voice_id: str, language: Optional[str] = None) -> bool:
         """
         Validate if a voice is available for a language
@@ -317,11 +526,8 @@ class VoiceManager:
         target_language = language or self.tts_service.output_language
         
         try:
-            available_voices = self.get_available_voices(target_language)
-            all_voices = available_voices.get("male", []) + available_voices.get("female", [])
-            
             # Check if voice ID exists in available voices
-            voice_ids = [voice.get("id") for voice in all_voices]
+            voice_ids, _ = self._get_voice_views(target_language)
             is_valid = voice_id in voice_ids
             
             if not is_valid:
@@ -344,18 +550,27 @@ class VoiceManager:
             dict: Voice information or None if not found
         """
         try:
-            # Search across all supported languages
-            for language in self.language_manager.supported_languages:
-                voices = self.get_available_voices(language)
-                all_voices = voices.get("male", []) + voices.get("female", [])
-                
-                for voice in all_voices:
-                    if voice.get("id") == voice_id:
-                        # Add language info to voice data
-                        voice_info = voice.copy()
-                        voice_info["supported_language"] = language
-                        voice_info["language_display_name"] = self.language_manager.get_language_display_name(language)
-                        return voice_info
+            # Voice IDs start with their language code (e.g. 'hi-IN-Neural2-A'),
+            # so check that one language before falling back to the full index
+            language = self._language_by_code.get('-'.join(voice_id.split('-', 2)[:2]))
+            voice = None
+            if language is not None:
+                voice_ids, _ = self._get_voice_views(language)
+                if voice_id in voice_ids:
+                    voices = self.get_available_voices(language)
+                    voice = next(v for v in voices["male"] + voices["female"] if v.id == voice_id)
+            
+            if voice is None:
+                index = self._voice_index
+                if index is None or time.monotonic() - self._voice_index_built_at >= _VOICES_CACHE_TTL:
+                    index = self._build_voice_index()
+                language, voice = index.get(voice_id, (None, None))
+            if voice is not None:
+                # Add language info to voice data
+                voice_info = voice.to_dict()
+                voice_info["supported_language"] = language
+                voice_info["language_display_name"] = self.language_manager.get_language_display_name(language)
+                return voice_info
             
             logger.warning(f"Voice {voice_id} not found in any language")
             return None
@@ -364,7 +579,7 @@ class VoiceManager:
             logger.error(f"Error getting voice info for {voice_id}: {e}")
             return None
     
-    def get_voices_by_gender(self, gender: str, language: Optional[str] = None) -> List[Dict]:
+    def get_voices_by_gender(self, gender: str, language: Optional[str] = None) -> List[VoiceEntry]:
         """
         Get voices filtered by gender
         
@@ -376,20 +591,21 @@ class VoiceManager:
             list: List of voices for the specified gender
         """
         target_language = language or self.tts_service.output_language
+        gender_key = gender.lower()
         
-        if gender.lower() not in ["male", "female"]:
+        if gender_key not in _GENDERS:
             logger.warning(f"Invalid gender filter: {gender}")
             return []
         
         try:
             voices = self.get_available_voices(target_language)
-            return voices.get(gender.lower(), [])
+            return voices.get(gender_key, [])
             
         except Exception as e:
             logger.error(f"Error getting {gender} voices for {target_language}: {e}")
             return []
     
-    def get_voices_by_model(self, model: str, language: Optional[str] = None) -> List[Dict]:
+    def get_voices_by_model(self, model: str, language: Optional[str] = None) -> List[VoiceEntry]:
         """
         Get voices filtered by TTS model
         
@@ -403,11 +619,9 @@ class VoiceManager:
         target_language = language or self.tts_service.output_language
         
         try:
-            voices = self.get_available_voices(target_language)
-            all_voices = voices.get("male", []) + voices.get("female", [])
-            
-            # Filter by model
-            model_voices = [voice for voice in all_voices if voice.get("model") == model]
+            # Voices are pre-grouped by model
+            _, voices_by_model = self._get_voice_views(target_language)
+            model_voices = list(voices_by_model.get(model, []))
             
             logger.info(f"Found {len(model_voices)} voices for model {model} in {target_language}")
             return model_voices
@@ -440,10 +654,10 @@ class VoiceManager:
             
             if voices:
                 # Prefer neural2 model, fallback to first available
-                neural2_voices = [v for v in voices if v.get("model") == "neural2"]
+                neural2_voices = [v for v in voices if v.model == "neural2"]
                 default_voice = neural2_voices[0] if neural2_voices else voices[0]
                 
-                voice_id = default_voice.get("id")
+                voice_id = default_voice.id
                 logger.info(f"Selected default voice {voice_id} for {target_language} ({gender})")
                 return voice_id
             
@@ -456,110 +670,98 @@ class VoiceManager:
     
     def get_voice_friendly_name(self, voice_id: str) -> str:
         """Extract a friendly name from voice ID"""
+        cached = self._friendly_name_cache.get(voice_id)
+        if cached is not None:
+            return cached
+        
         # If we have a friendly name, use it
         if voice_id in self.voice_names:
-            return self.voice_names[voice_id]
-        
-        # Otherwise, extract a meaningful name from the voice ID
-        # Format is usually: xx-XX-Model-Letter (e.g., en-US-Neural2-D)
-        parts = voice_id.split('-')
-        if len(parts) >= 4:
-            model = parts[2]  # Neural2, Wavenet, Standard
-            letter = parts[3]  # A, B, C, D, etc.
-            return f"{model}-{letter}"
+            name = self.voice_names[voice_id]
         else:
-            return voice_id.split('-')[-1]
+            # Otherwise, extract a meaningful name from the voice ID
+            # Format is usually: xx-XX-Model-Letter (e.g., en-US-Neural2-D)
+            parts = voice_id.split('-')
+            if len(parts) >= 4:
+                model = parts[2]  # Neural2, Wavenet, Standard
+                letter = parts[3]  # A, B, C, D, etc.
+                name = f"{model}-{letter}"
+            else:
+                name = parts[-1]
+        
+        self._friendly_name_cache[voice_id] = name
+        return name
     
     def _select_variant_voices(self, voices, max_count=2):
         """Select most variant voices from a list using smart criteria"""
+        if max_count == 2:
+            return self._select_two_variant_voices(voices)
+        
         if len(voices) <= max_count:
             return voices
         
-        # Sort voices for consistent selection
-        voices = sorted(voices, key=lambda v: v["id"])
-        
         if max_count == 1:
             # Pick the one with highest sample rate
-            return [max(voices, key=lambda v: v.get("natural_sample_rate", 0))]
-        
-        if max_count == 2:
-            # Strategy: Pick voices with maximum letter distance
-            # e.g., prefer A and F over A and B
-            
-            def get_voice_letter(voice_id):
-                """Extract the letter from voice ID (e.g., 'A' from 'en-US-Neural2-A')"""
-                parts = voice_id.split('-')
-                if len(parts) >= 4:
-                    suffix = parts[-1]
-                    # Handle different suffix formats
-                    if len(suffix) == 1 and suffix.isalpha():
-                        return suffix.upper()
-                    # For longer suffixes, use first character or hash-based approach
-                    return chr(65 + (hash(suffix) % 26))  # Convert to A-Z range
-                return 'A'
-            
-            # Add letter information
-            for voice in voices:
-                voice['_letter'] = get_voice_letter(voice['id'])
-            
-            # Try to pick voices with maximum letter distance
-            selected = []
-            
-            # First, pick voice with highest sample rate
-            best_quality = max(voices, key=lambda v: v.get("natural_sample_rate", 0))
-            selected.append(best_quality)
-            
-            # Second, pick voice with most different letter and different sample rate
-            remaining = [v for v in voices if v['id'] != best_quality['id']]
-            if remaining:
-                best_letter = best_quality['_letter']
-                
-                # Calculate letter distance (A=0, B=1, etc.)
-                def letter_distance(letter1, letter2):
-                    try:
-                        return abs(ord(letter1.upper()) - ord(letter2.upper()))
-                    except (TypeError, AttributeError):
-                        # Fallback if letters are not single characters
-                        return abs(hash(str(letter1)) % 26 - hash(str(letter2)) % 26)
-                
-                # Pick voice with maximum letter distance
-                most_different = max(remaining, 
-                    key=lambda v: (
-                        letter_distance(best_letter, v['_letter']),
-                        abs(v.get("natural_sample_rate", 0) - best_quality.get("natural_sample_rate", 0))
-                    ))
-                selected.append(most_different)
-            
-            # Remove temporary data
-            for voice in voices:
-                voice.pop('_letter', None)
-            
-            return selected
+            return [min(voices, key=_quality_key)]
         
         # For max_count > 2, pick evenly distributed voices
+        voices = sorted(voices, key=lambda v: v.id)
         step = len(voices) // max_count
         return [voices[i * step] for i in range(max_count)]
+    
+    @staticmethod
+    def _select_two_variant_voices(voices):
+        """
+        Specialized _select_variant_voices for max_count=2, the only count
+        used when listing voices
+        
+        Strategy: Pick voices with maximum letter distance
+        e.g., prefer A and F over A and B
+        """
+        if len(voices) <= 2:
+            return voices
+        
+        # First, pick voice with highest sample rate
+        best_quality = min(voices, key=_quality_key)
+        best_letter = ord(_voice_letter(best_quality.id))
+        best_rate = best_quality.natural_sample_rate or 0
+        
+        # Second, in one linear pass, pick the voice with the most different
+        # letter (A=0, B=1, etc.), then the most different sample rate
+        most_different = None
+        most_different_key = None
+        for voice in voices:
+            if voice.id == best_quality.id:
+                continue
+            key = (
+                abs(ord(_voice_letter(voice.id)) - best_letter),
+                abs((voice.natural_sample_rate or 0) - best_rate)
+            )
+            if (most_different is None or key > most_different_key
+                    or (key == most_different_key and voice.id < most_different.id)):
+                most_different, most_different_key = voice, key
+        
+        return [best_quality, most_different]
 
-    def _get_fallback_voices(self, target_lang: str) -> Dict[str, List[Dict]]:
+    def _get_fallback_voices(self, target_lang: str) -> Dict[str, List[VoiceEntry]]:
         """Fallback method using hardcoded voices when API fails"""
+        return self._fallback_voices_cache.get(target_lang, {"male": [], "female": []})
+    
+    def _build_fallback_voices(self, target_lang: str) -> Dict[str, List[VoiceEntry]]:
+        """Build the fallback voice listing for a language from the hardcoded mapping"""
         if target_lang not in self.voice_mapping:
             return {"male": [], "female": []}
             
-        lang_voices = self.voice_mapping[target_lang]
         result = {"male": [], "female": []}
         
-        for model in ["neural2", "wavenet", "standard"]:
-            if model in lang_voices:
-                for gender in ["male", "female"]:
-                    if gender in lang_voices[model]:
-                        voice_id = lang_voices[model][gender]
-                        
-                        result[gender].append({
-                            "id": voice_id,
-                            "name": self.get_voice_friendly_name(voice_id),
-                            "model": model,
-                            "gender": gender,
-                            "language": target_lang
-                        })
+        for model, gender in itertools.product(_MODELS, _GENDERS):
+            voice_id = self._flat_voice_mapping.get((target_lang, model, gender))
+            if voice_id is not None:
+                result[gender].append(VoiceEntry(
+                    id=voice_id,
+                    name=self.get_voice_friendly_name(voice_id),
+                    model=model,
+                    gender=gender,
+                    language=target_lang
+                ))
         
         return result 
\ No newline at end of file
@@ -215,28 +215,14 @@ export const VoiceInterface: React.FC<VoiceInterfaceProps> = ({
         ? "Hello, this is a preview of my voice. How does this sound to you?"
         : "Hello, this is a preview of my voice. How does this sound to you?"; // Backend will translate this
 
-      // Call real backend API for voice preview
-      const response = await fetch(`${API_BASE}/api/audio/voice-preview`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          text: previewText,
-          voice: voiceId,
-          language: selectedLanguage,
-          speed: selectedSpeed
-        })
+      // Stream the preview: the audio element starts playing as the first chunks arrive
+      const params = new URLSearchParams({
+        text: previewText,
+        voice: voiceId,
+        language: selectedLanguage,
+        speed: String(selectedSpeed)
       });
-
-      if (response.ok) {
-        const data = await response.json();
-        await playAudioBase64(data.audio);
-      } else {
-        const errorText = await response.text();
-        console.error('Voice preview failed:', errorText);
-        // Fallback: Simulate voice preview
-        console.log(`Playing preview for voice: ${voiceId} in ${selectedLanguage} at ${selectedSpeed}x speed`);
-        await new Promise(resolve => setTimeout(resolve, 1500)); // Simulate audio playback
-      }
+      await playAudioUrl(`${API_BASE}/api/audio/voice-preview/stream?${params}`);
     } catch (error) {
       console.error('Voice preview failed:', error);
       // Fallback: Simulate voice preview
@@ -246,41 +232,15 @@ export const VoiceInterface: React.FC<VoiceInterfaceProps> = ({
     }
   };
 
-  const playAudioBase64 = async (audioBase64: string): Promise<void> => {
+  const playAudioUrl = async (audioUrl: string): Promise<void> => {
     return new Promise((resolve, reject) => {
-      try {
-        const audioBlob = base64ToBlob(audioBase64, 'audio/mpeg');
-        const audioUrl = URL.createObjectURL(audioBlob);
-        const audio = new Audio(audioUrl);
-        
-        audio.onended = () => {
-          URL.revokeObjectURL(audioUrl);
-          resolve();
-        };
-        audio.onerror = () => {
-          URL.revokeObjectURL(audioUrl);
-          reject(new Error('Audio playback failed'));
-        };
-        
-        audio.play();
-      } catch (error) {
-        reject(error);
-      }
+      const audio = new Audio(audioUrl);
+      audio.onended = () => resolve();
+      audio.onerror = () => reject(new Error('Audio playback failed'));
+      audio.play().catch(reject);
     });
   };
 
-  const base64ToBlob = (base64: string, mimeType: string): Blob => {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-    
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: mimeType });
-  };
-
   // Check if interview has meaningful progress
   const hasInterviewStarted = () => {
     return conversationState !== 'not_started' && conversationState !== 'completed';
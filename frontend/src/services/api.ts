@@ -259,7 +259,9 @@ export class AudioRecorder {
 
       this.audioChunks = [];
       this.mediaRecorder = new MediaRecorder(this.stream, {
-        mimeType: 'audio/webm;codecs=opus'
+        mimeType: 'audio/webm;codecs=opus',
+        // Speech needs far less than the ~128 kbps browser default; smaller uploads reach STT sooner
+        audioBitsPerSecond: 24000
       });
 
       this.mediaRecorder.ondataavailable = (event) => {
@@ -325,6 +327,11 @@ export class AudioRecorder {
   }
 }
 
+// TTS audio is OGG/Opus by default, or MP3 when the backend sets TTS_AUDIO_FORMAT=mp3.
+// Ogg streams start with "OggS", which base64-encodes to "T2dnUw".
+export const getAudioMimeType = (audioBase64: string): string =>
+  audioBase64.startsWith('T2dnUw') ? 'audio/ogg; codecs=opus' : 'audio/mpeg';
+
 // Audio player for agent responses
 export class AudioPlayer {
   private audio: HTMLAudioElement | null = null;
@@ -332,7 +339,7 @@ export class AudioPlayer {
   async playBase64Audio(audioBase64: string): Promise<void> {
     return new Promise((resolve, reject) => {
       try {
-        const audioBlob = this.base64ToBlob(audioBase64, 'audio/mpeg');
+        const audioBlob = this.base64ToBlob(audioBase64, getAudioMimeType(audioBase64));
         const audioUrl = URL.createObjectURL(audioBlob);
         
         this.audio = new Audio(audioUrl);